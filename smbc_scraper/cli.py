@@ -50,13 +50,12 @@ async def run_smbc(args: argparse.Namespace):
     console.print(
         "[bold yellow]Starting Ground-Truth Scrape from smbc-comics.com[/bold yellow]"
     )
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = SmbcScraper(http_client, str(args.data_dir))
         results = await scraper.scrape_id_range(args.start_id, args.end_id)
         save_comics(results, args.output_dir, "smbc_ground_truth")
-    finally:
-        await http_client.close()
 
 
 async def run_smbc_all(args: argparse.Namespace):
@@ -65,8 +64,9 @@ async def run_smbc_all(args: argparse.Namespace):
         "[bold yellow]Starting full SMBC archive scrape "
         "with image downloads[/bold yellow]"
     )
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = SmbcScraper(http_client, str(args.data_dir))
         rows, latest_legacy_id = await scraper.scrape_full_archive(
             start_id=args.start_id or 1, limit=args.limit
@@ -76,8 +76,6 @@ async def run_smbc_all(args: argparse.Namespace):
             args.output_dir / DEFAULT_INCREMENTAL_STATE_FILENAME,
             IncrementalScrapeState(last_scraped_id=latest_legacy_id),
         )
-    finally:
-        await http_client.close()
 
 
 async def run_smbc_update(args: argparse.Namespace):
@@ -87,8 +85,9 @@ async def run_smbc_update(args: argparse.Namespace):
         args.output_dir / DEFAULT_INCREMENTAL_STATE_FILENAME
     )
     source_csv = args.output_dir / "smbc_ground_truth.csv"
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = SmbcScraper(http_client, str(args.data_dir))
         existing_rows = load_comics(source_csv)
 
@@ -138,16 +137,15 @@ async def run_smbc_update(args: argparse.Namespace):
             save_incremental_state(
                 state_path, IncrementalScrapeState(last_scraped_id=last_successful_id)
             )
-    finally:
-        await http_client.close()
 
 
 async def run_smbc_missing(args: argparse.Namespace):
     """Handler for the 'smbc-missing' subcommand."""
     console.print("[bold yellow]Starting Scrape of missing SMBC IDs[/bold yellow]")
     source_csv = args.source_csv or (args.output_dir / "smbc_ground_truth.csv")
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = SmbcScraper(http_client, str(args.data_dir))
         existing_rows = load_comics(source_csv)
         new_rows = await scraper.scrape_missing_ids(source_csv)
@@ -160,8 +158,6 @@ async def run_smbc_missing(args: argparse.Namespace):
             console.print(
                 f"[bold green]Added {len(new_rows)} missing comics.[/bold green]"
             )
-    finally:
-        await http_client.close()
 
 
 async def run_smbc_rebuild(args: argparse.Namespace):
@@ -170,36 +166,35 @@ async def run_smbc_rebuild(args: argparse.Namespace):
         "[bold yellow]Rebuilding SMBC ID index from local HTML files...[/bold yellow]"
     )
     source_csv = args.source_csv or (args.output_dir / "smbc_ground_truth.csv")
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = SmbcScraper(http_client, str(args.data_dir))
         updated_rows = await scraper.rebuild_id_index_from_local_files(source_csv)
         save_comics(updated_rows, args.output_dir, "smbc_ground_truth")
         console.print("[bold green]Local index rebuild complete.[/bold green]")
-    finally:
-        await http_client.close()
 
 
 async def run_ohnorobot(args: argparse.Namespace):
     """Handler for the 'ohnorobot' subcommand."""
     console.print("[bold yellow]Starting Scrape from ohnorobot.com[/bold yellow]")
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = OhNoRobotScraper(http_client)
         # The scraper reads the output_dir to find source CSVs and generate
         # its own queries.
         results = await scraper.scrape(input_dir=args.output_dir, limit=args.limit)
         save_comics(results, args.output_dir, "ohnorobot")
-    finally:
-        await http_client.close()
 
 
 async def run_smbc_images(args: argparse.Namespace):
     """Handler for the SMBC image backfill subcommand."""
     console.print("[bold yellow]Starting SMBC image backfill[/bold yellow]")
     source_csv = args.source_csv or (args.output_dir / "smbc_ground_truth.csv")
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = SmbcScraper(http_client, str(args.data_dir))
         downloaded_images = await scraper.backfill_images(
             source_csv_path=source_csv,
@@ -210,20 +205,17 @@ async def run_smbc_images(args: argparse.Namespace):
         console.print(
             f"[bold green]Downloaded {downloaded_images} SMBC image(s).[/bold green]"
         )
-    finally:
-        await http_client.close()
 
 
 async def run_wiki(args: argparse.Namespace):
     """Handler for the 'wiki' subcommand."""
     console.print("[bold yellow]Starting Scrape from smbc-wiki.com API[/bold yellow]")
-    http_client = HttpClient(cache_dir=str(args.cache_dir), rate_limit=args.max_rate)
-    try:
+    async with HttpClient(
+        cache_dir=str(args.cache_dir), rate_limit=args.max_rate
+    ) as http_client:
         scraper = SmbcWikiScraper(http_client)
         results = await scraper.scrape_id_range(args.start_id, args.end_id)
         save_comics(results, args.output_dir, "smbc_wiki")
-    finally:
-        await http_client.close()
 
 
 async def run_ocr(args: argparse.Namespace):
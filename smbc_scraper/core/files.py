@@ -2,14 +2,49 @@
 
 from __future__ import annotations
 
+import datetime
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
 
 from loguru import logger
 
 from smbc_scraper.models import ComicRow
 
+DEFAULT_IMAGE_EXTENSION = ".png"
+
+
+def _image_extension(image_url: str) -> str:
+    """
+    Return the file extension of the last path segment of *image_url*.
+
+    Plain string scanning is enough here; the URL never needs to be parsed.
+    """
+    end = len(image_url)
+    for delimiter in "?#":
+        index = image_url.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+
+    path_start = 0
+    scheme_end = image_url.find("://", 0, end)
+    if scheme_end != -1:
+        # Skip the host so 'https://example.com' does not yield '.com'.
+        path_start = image_url.find("/", scheme_end + 3, end)
+        if path_start == -1:
+            return DEFAULT_IMAGE_EXTENSION
+
+    name_start = max(path_start, image_url.rfind("/", path_start, end) + 1)
+    dot = image_url.rfind(".", name_start, end)
+    if dot <= name_start or dot == end - 1:
+        return DEFAULT_IMAGE_EXTENSION
+    return image_url[dot:end]
+
+
+def _dated_dir(base_dir: Path, kind: str, comic_date: datetime.date) -> Path:
+    """Return base_dir/kind/YYYY/MM/DD for a publication date."""
+    year, month, day = comic_date.isoformat().split("-")
+    return base_dir / kind / year / month / day
+
 
 def get_image_path(
     base_dir: Path, comic_row: ComicRow, image_url: str, is_votey: bool = False
@@ -18,13 +53,7 @@ def get_image_path(
     Constructs a structured path for saving a comic image.
     e.g., /base/images/2025/09/13/2025-09-13-main.png
     """
-    try:
-        parsed_url = urlparse(image_url)
-        extension = Path(parsed_url.path).suffix
-        if not extension:
-            extension = ".png"  # Assume png if no extension found
-    except Exception:
-        extension = ".png"
+    extension = _image_extension(image_url)
 
     suffix = "votey" if is_votey else "main"
     filename = f"{comic_row.slug}-{suffix}{extension}"
@@ -37,16 +66,7 @@ def get_image_path(
         return base_dir / "images" / "misc" / filename
 
     # Structured path: data/images/YYYY/MM/DD/
-    image_path = (
-        base_dir
-        / "images"
-        / str(comic_row.date.year)
-        / f"{comic_row.date.month:02d}"
-        / f"{comic_row.date.day:02d}"
-        / filename
-    )
-
-    return image_path
+    return _dated_dir(base_dir, "images", comic_row.date) / filename
 
 
 def get_html_path(base_dir: Path, comic_row: ComicRow) -> Path:
@@ -58,11 +78,12 @@ def get_html_path(base_dir: Path, comic_row: ComicRow) -> Path:
         # Fallback for pages where date parsing might fail
         return base_dir / "html" / "misc" / f"{comic_row.slug}.html"
 
-    return (
-        base_dir
-        / "html"
-        / str(comic_row.date.year)
-        / f"{comic_row.date.month:02d}"
-        / f"{comic_row.date.day:02d}"
-        / f"{comic_row.slug}.html"
-    )
+    return _dated_dir(base_dir, "html", comic_row.date) / f"{comic_row.slug}.html"
+
+
+def get_id_index_path(base_dir: Path, comic_id: int) -> Path:
+    """
+    Constructs the path of the per-ID sidecar written after a complete scrape.
+    e.g., /base/by_id/1234.json
+    """
+    return base_dir / "by_id" / f"{comic_id}.json"
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import re
+import sqlite3
 from pathlib import Path
 from typing import Optional, Protocol
 
+import anysqlite
 import httpx
-from hishel import AsyncCacheTransport, AsyncFileStorage, Controller
+from hishel import (
+    AsyncBaseStorage,
+    AsyncCacheTransport,
+    AsyncInMemoryStorage,
+    AsyncSQLiteStorage,
+    Controller,
+)
 from loguru import logger
 from tenacity import (
     AsyncRetrying,
@@ -16,22 +26,93 @@ from tenacity import (
     wait_exponential,
 )
 
+CACHE_DB_FILENAME = "cache.sqlite"
+DOWNLOAD_CHUNK_SIZE = 65536
+# hishel's AsyncFileStorage names each entry after its hex cache key.
+_FILE_CACHE_KEY_RE = re.compile(r"[0-9a-f]{16,}")
+
+
+def open_cache_db(cache_dir: Path) -> sqlite3.Connection:
+    """
+    Open the SQLite HTTP cache in *cache_dir*, creating it if needed.
+
+    hishel's own schema has no index on ``key``, so every lookup would scan the
+    whole table; the index is added here. Entries left by the older
+    one-file-per-response cache are imported the first time the database is
+    created.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    db_path = cache_dir / CACHE_DB_FILENAME
+    is_new = not db_path.exists()
+
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS cache(key TEXT, data BLOB, date_created REAL)"
+    )
+    connection.execute("CREATE INDEX IF NOT EXISTS cache_key_idx ON cache(key)")
+    if is_new:
+        _import_file_cache(connection, cache_dir)
+    connection.commit()
+    return connection
+
+
+def _import_file_cache(connection: sqlite3.Connection, cache_dir: Path) -> None:
+    entries = [
+        path
+        for path in cache_dir.iterdir()
+        if path.is_file() and _FILE_CACHE_KEY_RE.fullmatch(path.name)
+    ]
+    if not entries:
+        return
+
+    logger.info(f"Importing {len(entries)} file-cache entries into {CACHE_DB_FILENAME}")
+    connection.executemany(
+        "INSERT INTO cache(key, data, date_created) VALUES(?, ?, ?)",
+        (
+            (path.name, path.read_text(encoding="utf-8"), path.stat().st_mtime)
+            for path in entries
+        ),
+    )
+
 
 class RateLimiter:
-    """A simple async rate limiter to ensure we don't hit servers too fast."""
+    """
+    An async token-bucket rate limiter to ensure we don't hit servers too fast.
+
+    Tokens refill at ``rate`` per second up to ``burst`` (default: ``rate``), so
+    idle time can be spent on a short burst. The bucket starts with one token.
 
-    def __init__(self, rate: float = 10.0):
-        self.period = 1.0 / rate
-        self.last_request_time = 0.0
-        self._lock = asyncio.Lock()
+    Each caller reserves its token before sleeping, letting the balance go
+    negative, so concurrent waiters queue up without a lock: there is no await
+    between reading and updating the bucket.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.tokens = 1.0
+        self.last_refill_time: Optional[float] = None
 
     async def wait(self):
-        async with self._lock:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self.last_request_time
-            if elapsed < self.period:
-                await asyncio.sleep(self.period - elapsed)
-            self.last_request_time = asyncio.get_event_loop().time()
+        now = asyncio.get_running_loop().time()
+        if self.last_refill_time is not None:
+            elapsed = now - self.last_refill_time
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.last_refill_time = now
+
+        self.tokens -= 1.0
+        if self.tokens < 0:
+            try:
+                await asyncio.sleep(-self.tokens / self.rate)
+            except asyncio.CancelledError:
+                # A cancelled caller sends nothing; give its token back.
+                self.tokens += 1.0
+                raise
+
+
+_ResponseTask = asyncio.Task[Optional[httpx.Response]]
 
 
 class HttpGetClient(Protocol):
@@ -40,16 +121,33 @@ class HttpGetClient(Protocol):
     async def get(self, url: str) -> Optional[httpx.Response]: ...
 
 
+class HttpDownloadClient(HttpGetClient, Protocol):
+    """GET surface plus streaming file downloads, for scrapers that save images."""
+
+    async def download(self, url: str, path: Path) -> bool: ...
+
+
 class HttpClient:
     """HTTP wrapper with caching, retries, and rate limiting."""
 
     def __init__(
         self,
-        cache_dir: str | Path,
+        cache_dir: str | Path | None = None,
         rate_limit: float = 10.0,
         user_agent: str = "SMBC-Scraper/1.0",
+        max_concurrency: int = 128,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        storage: Optional[AsyncBaseStorage] = None,
     ):
         self.rate_limiter = RateLimiter(rate_limit)
+        self._sem = asyncio.Semaphore(max_concurrency)
+        # Single-flight: concurrent GETs of one URL share the in-flight task.
+        # Entries are dropped on completion, so no responses are pinned here;
+        # repeat fetches are served by the hishel cache. Each task counts its
+        # waiters so it can be cancelled once none are left.
+        self._in_flight: dict[str, _ResponseTask] = {}
+        self._waiters: dict[_ResponseTask, int] = {}
 
         # Define retry strategy
         self.retryer = AsyncRetrying(
@@ -61,33 +159,96 @@ class HttpClient:
             reraise=True,
         )
 
-        # Set up caching transport
-        transport = AsyncCacheTransport(
-            transport=httpx.AsyncHTTPTransport(
-                retries=0
-            ),  # Retries handled by tenacity
+        # Set up caching transport. Pool limits and HTTP/2 must be configured
+        # on the inner transport; httpx ignores them on a client that is given
+        # a custom transport. An injected transport (e.g. httpx.MockTransport
+        # in tests) replaces only the network layer under the cache.
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                retries=0,  # Retries handled by tenacity
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30,
+                ),
+            )
+        # Without a cache directory (e.g. in tests) responses are cached in
+        # memory for the lifetime of the client.
+        if storage is None:
+            if cache_dir is None:
+                storage = AsyncInMemoryStorage()
+            else:
+                storage = AsyncSQLiteStorage(
+                    connection=anysqlite.Connection(open_cache_db(Path(cache_dir)))
+                )
+        cache_transport = AsyncCacheTransport(
+            transport=transport,
             controller=Controller(cacheable_methods=["GET"]),
-            storage=AsyncFileStorage(base_path=Path(cache_dir)),
+            storage=storage,
         )
 
+        headers = {"User-Agent": user_agent}
+        timeout = httpx.Timeout(30.0, connect=10.0)
         self.client = httpx.AsyncClient(
-            transport=transport,
-            headers={"User-Agent": user_agent},
+            transport=cache_transport, headers=headers, timeout=timeout
+        )
+        # hishel reads every response body in full (and stores it) before
+        # returning it, so image downloads bypass the cache and stream
+        # straight off the same network transport and connection pool.
+        self._download_client = httpx.AsyncClient(
+            transport=transport, headers=headers, timeout=timeout
         )
         logger.info(
             "HttpClient initialized. "
-            f"Rate limit: {rate_limit} req/s. Cache: {cache_dir}"
+            f"Rate limit: {rate_limit} req/s. "
+            f"Max concurrency: {max_concurrency}. Cache: {cache_dir or 'in-memory'}"
         )
 
     async def get(self, url: str) -> Optional[httpx.Response]:
-        """Performs a rate-limited, retrying GET request."""
-        await self.rate_limiter.wait()
+        """Performs a rate-limited, retrying GET request.
 
+        Callers asking for a URL that is already in flight await the same
+        task rather than issuing another request.
+        """
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch(url))
+            task.add_done_callback(lambda t: self._forget(url, t))
+            self._in_flight[url] = task
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so one cancelled caller does not cancel a fetch that
+            # others are still waiting on.
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    # The last waiter gave up: stop the fetch, and stop
+                    # sharing it with callers that arrive meanwhile.
+                    self._forget(url, task)
+                    task.cancel()
+
+    def _forget(self, url: str, task: _ResponseTask) -> None:
+        """Drop a finished fetch so only in-flight requests are shared."""
+        if self._in_flight.get(url) is task:
+            del self._in_flight[url]
+
+    async def _fetch(self, url: str) -> Optional[httpx.Response]:
+        async with self._sem:
+            await self.rate_limiter.wait()
+            return await self._get_with_retries(url)
+
+    async def _get_with_retries(self, url: str) -> Optional[httpx.Response]:
         try:
             async for attempt in self.retryer:
                 with attempt:
                     logger.debug(
-                        f"GET {url} (Attempt {attempt.retry_state.attempt_number})"
+                        "GET {} (Attempt {})",
+                        url,
+                        attempt.retry_state.attempt_number,
                     )
                     response = await self.client.get(url)
 
@@ -106,7 +267,66 @@ class HttpClient:
 
         return None  # Should be unreachable
 
+    async def download(self, url: str, path: Path) -> bool:
+        """Streams a rate-limited, retrying GET of *url* into *path*.
+
+        Downloads skip the response cache. The body is written in chunks to a
+        ``.part`` sibling and moved into place only when complete, so it is
+        never held whole in memory and a failed download never leaves a
+        truncated file behind.
+        """
+        part_path = path.with_name(path.name + ".part")
+        async with self._sem:
+            await self.rate_limiter.wait()
+            try:
+                async for attempt in self.retryer:
+                    with attempt:
+                        logger.debug(
+                            "GET {} (streaming, Attempt {})",
+                            url,
+                            attempt.retry_state.attempt_number,
+                        )
+                        async with self._download_client.stream("GET", url) as response:
+                            if (
+                                response.status_code in {403, 429}
+                                or response.status_code >= 500
+                            ):
+                                response.raise_for_status()
+                            if response.status_code != 200:
+                                logger.warning(
+                                    f"Failed to fetch {url}. "
+                                    f"Status: {response.status_code}"
+                                )
+                                return False
+
+                            with part_path.open("wb") as f:
+                                async for chunk in response.aiter_bytes(
+                                    DOWNLOAD_CHUNK_SIZE
+                                ):
+                                    f.write(chunk)
+                        os.replace(part_path, path)
+                        return True
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to fetch {url}: {e}")
+            except OSError as e:
+                logger.error(f"Failed to write {url} to {path}: {e}")
+
+            part_path.unlink(missing_ok=True)
+            return False
+
+    async def __aenter__(self) -> HttpClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
     async def close(self):
-        """Closes the underlying httpx client."""
+        """Cancels outstanding fetches, then closes the underlying httpx clients."""
+        tasks = list(self._in_flight.values())
+        self._in_flight.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         await self.client.aclose()
+        await self._download_client.aclose()
         logger.info("HttpClient closed.")
@@ -18,5 +18,8 @@ def setup_logging(level: str = "INFO"):
             "<cyan>{line}</cyan> - <level>{message}</level>"
         ),
         colorize=True,
+        # Hand records to a background thread so stderr writes never block
+        # the event loop on the per-request debug path.
+        enqueue=True,
     )
     logger.info(f"Logging configured at level: {level}")
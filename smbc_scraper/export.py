@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import csv
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, List
 
 import pandas as pd
+import xlsxwriter
 from loguru import logger
 from rich.console import Console
 
@@ -15,6 +20,8 @@ from smbc_scraper.models import ComicRow
 
 console = Console()
 
+_COMIC_FIELDS = tuple(ComicRow.model_fields)
+
 
 def _normalize_optional_csv_value(value: str | None) -> str | None:
     if value is None:
@@ -58,6 +65,67 @@ def merge_comics(
     return sort_comics(list(merged_by_url.values()))
 
 
+def _write_csv(df: pd.DataFrame, path: Path) -> bool:
+    df.to_csv(path, index=False, encoding="utf-8")
+    return True
+
+
+def _write_xlsx(df: pd.DataFrame, path: Path) -> bool:
+    """
+    Stream rows into an XLSX workbook using xlsxwriter's constant-memory mode.
+
+    pandas' ``to_excel`` emits cells column by column, which constant-memory
+    mode (it flushes one row at a time) silently drops, so rows are written
+    here directly in order.
+    """
+    workbook = xlsxwriter.Workbook(
+        path,
+        {
+            "constant_memory": True,
+            "strings_to_urls": False,
+            "strings_to_formulas": False,
+        },
+    )
+    try:
+        sheet = workbook.add_worksheet()
+        date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+        sheet.write_row(0, 0, list(df.columns), workbook.add_format({"bold": True}))
+        for row_idx, values in enumerate(
+            df.itertuples(index=False, name=None), start=1
+        ):
+            for col_idx, value in enumerate(values):
+                if pd.isna(value):
+                    continue
+                if isinstance(value, date):
+                    sheet.write_datetime(row_idx, col_idx, value, date_format)
+                else:
+                    sheet.write(row_idx, col_idx, value)
+    finally:
+        workbook.close()
+    return True
+
+
+def _write_parquet(data: list[dict[str, Any]], path: Path) -> bool:
+    """
+    Write rows straight to an Arrow table, skipping the DataFrame round trip.
+
+    Parquet is optional; report failures instead of aborting the export.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        logger.warning("`pyarrow` is not installed. Skipping Parquet export.")
+        return False
+
+    try:
+        pq.write_table(pa.Table.from_pylist(data), path, compression="zstd")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to export to Parquet: {e}")
+    return False
+
+
 def save_comics(
     rows: List[ComicRow],
     output_dir: Path,
@@ -78,42 +146,48 @@ def save_comics(
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Convert Pydantic models to a list of dicts for pandas
-    # data = [row.model_dump(mode="json") for row in rows]
-    data = [row.model_dump() for row in sort_comics(rows)]
-    df = pd.DataFrame(data)
-
-    # Ensure consistent column order
-    column_order = list(ComicRow.model_fields.keys())
-    df = df[column_order]
+    # ComicRow is flat, so plain attribute reads give the same dicts as
+    # model_dump() without running the serializer per row.
+    data = [
+        {field_name: getattr(row, field_name) for field_name in _COMIC_FIELDS}
+        for row in sort_comics(rows)
+    ]
+    # Build in model field order directly; a reindex afterwards would copy
+    # every column again.
+    df = pd.DataFrame(data, columns=list(_COMIC_FIELDS))
 
     base_path = output_dir / source_name
+    writers: list[tuple[Path, Callable[[Path], bool]]] = []
+    if "csv" in formats:
+        writers.append((base_path.with_suffix(".csv"), partial(_write_csv, df)))
+    if "xlsx" in formats:
+        writers.append((base_path.with_suffix(".xlsx"), partial(_write_xlsx, df)))
+    if "parquet" in formats:
+        writers.append(
+            (base_path.with_suffix(".parquet"), partial(_write_parquet, data))
+        )
 
     with console.status(
         f"[bold green]Exporting {len(rows)} rows for '{source_name}'..."
     ):
-        # Save to CSV
-        if "csv" in formats:
-            csv_path = base_path.with_suffix(".csv")
-            df.to_csv(csv_path, index=False, encoding="utf-8")
-            logger.info(f"Saved {len(df)} rows to {csv_path}")
-
-        # Save to XLSX
-        if "xlsx" in formats:
-            xlsx_path = base_path.with_suffix(".xlsx")
-            df.to_excel(xlsx_path, index=False, engine="openpyxl")
-            logger.info(f"Saved {len(df)} rows to {xlsx_path}")
-
-        # Save to Parquet (optional)
-        if "parquet" in formats:
-            try:
-                parquet_path = base_path.with_suffix(".parquet")
-                df.to_parquet(parquet_path, index=False, engine="pyarrow")
-                logger.info(f"Saved {len(df)} rows to {parquet_path}")
-            except ImportError:
-                logger.warning("`pyarrow` is not installed. Skipping Parquet export.")
-            except Exception as e:
-                logger.error(f"Failed to export to Parquet: {e}")
+        # The CSV and Parquet writers release the GIL in C/Arrow code, so they
+        # overlap with the (slow, pure-Python) XLSX writer instead of queuing.
+        with ThreadPoolExecutor(max_workers=max(1, len(writers))) as executor:
+            futures = {
+                executor.submit(writer, path): path for path, writer in writers
+            }
+            written: list[Path] = []
+            for future in as_completed(futures):
+                if future.result():
+                    written.append(futures[future])
+                    logger.info(f"Saved {len(df)} rows to {futures[future]}")
+
+        # Writers finish in arbitrary order; give this export's files one
+        # shared mtime so freshness checks between formats (e.g. Parquet vs
+        # CSV in OhNoRobotScraper) don't depend on which finished last.
+        now_ns = time.time_ns()
+        for path in written:
+            os.utime(path, ns=(now_ns, now_ns))
 
     console.print(
         f"[bold green]Export complete for source '{source_name}'.[/bold green]"
@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from pathlib import Path
 from typing import List, Optional, Set
-from urllib.parse import parse_qs, urlencode, urljoin, urlparse
+from urllib.parse import urlencode, urljoin, urlparse, urlsplit
 
+import httpx
 import pandas as pd
 from loguru import logger
 from rich.progress import Progress
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 
 from smbc_scraper.core.http import HttpGetClient
 from smbc_scraper.models import ComicRow
 
+_TITLE_PREFIX_RE = re.compile(r"Saturday Morning Breakfast Cereal -?", re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9\s]")
+_QUERY_SOURCE_COLUMNS = ["url", "page_title"]
+_ID_PARAM_RE = re.compile(r"[?&]id=([^&#]+)")
+
+# (0, legacy_id, "") for numeric identifiers, (1, 0, slug) for modern slugs.
+ComicKey = tuple[int, int, str]
+
 
 class OhNoRobotScraper:
     """Scrapes comic transcripts from ohnorobot.com search results."""
@@ -20,8 +30,16 @@ class OhNoRobotScraper:
     BASE_URL = "https://www.ohnorobot.com/index.php"
     SMBC_BASE_URL = "https://www.smbc-comics.com/"
 
-    def __init__(self, http_client: HttpGetClient):
+    _SEL_RESULT = "li > blockquote"
+    _SEL_LINK = "a.searchlink"
+    # Result metadata stripped from each blockquote before taking its text.
+    # Applied in order: a <p> nested in the tinylink div goes with the div,
+    # and the next <p> (the summary) is removed after it.
+    _SEL_REMOVE = ("div.tinylink", "p")
+
+    def __init__(self, http_client: HttpGetClient, query_concurrency: int = 16):
         self.client = http_client
+        self.query_concurrency = query_concurrency
 
     def _normalize_smbc_url(self, url: str) -> str:
         """Normalize search result links to absolute SMBC URLs."""
@@ -29,35 +47,89 @@ class OhNoRobotScraper:
 
     def _get_identifier_from_url(self, url: str) -> Optional[str]:
         """Extract the comic identifier from either a legacy or modern SMBC URL."""
+        normalized_url = self._normalize_smbc_url(url)
+        if match := _ID_PARAM_RE.search(normalized_url):
+            return match.group(1)
+
         try:
-            parsed_url = urlparse(self._normalize_smbc_url(url))
-            query_params = parse_qs(parsed_url.query)
-            if "id" in query_params and query_params["id"]:
-                return query_params["id"][0]
-
-            path = parsed_url.path.rstrip("/")
-            if path and path != "/":
-                slug = path.split("/")[-1]
-                if slug and slug != "index.php":
-                    return slug
-        except Exception as e:
+            path = urlsplit(normalized_url).path.rstrip("/")
+        except ValueError as e:
             logger.warning(f"Could not parse comic identifier from URL '{url}': {e}")
+            return None
+
+        slug = path.rpartition("/")[2]
+        if slug and slug != "index.php":
+            return slug
         return None
 
     @staticmethod
-    def _sort_key(row: ComicRow) -> tuple[int, str]:
+    def _sort_key(row: ComicRow) -> ComicKey:
         """Sort numeric legacy IDs numerically and modern slugs lexicographically."""
         if row.slug.isdigit():
-            return (0, f"{int(row.slug):010d}")
-        return (1, row.slug)
+            return (0, int(row.slug), "")
+        return (1, 0, row.slug)
+
+    @staticmethod
+    def _find_query_source(base_path: Path) -> Optional[Path]:
+        """
+        Pick the export to read for *base_path*, preferring Parquet.
+
+        The Parquet file is only used when it is at least as new as the CSV, so
+        a CSV-only re-export is never shadowed by a stale Parquet file.
+        """
+        csv_path = base_path.with_suffix(".csv")
+        parquet_path = base_path.with_suffix(".parquet")
+        if parquet_path.exists() and (
+            not csv_path.exists()
+            or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+        ):
+            return parquet_path
+        if csv_path.exists():
+            return csv_path
+        return None
+
+    @classmethod
+    def _read_query_source(cls, path: Path) -> pd.DataFrame:
+        """Read only the columns needed for query generation from an export."""
+        if path.suffix == ".parquet":
+            try:
+                return pd.read_parquet(
+                    path, columns=_QUERY_SOURCE_COLUMNS, engine="pyarrow"
+                )
+            except ImportError:
+                logger.debug("`pyarrow` is not installed. Reading the CSV instead.")
+                return cls._read_query_source(path.with_suffix(".csv"))
+
+        try:
+            return pd.read_csv(
+                path,
+                engine="pyarrow",
+                usecols=_QUERY_SOURCE_COLUMNS,
+                dtype_backend="pyarrow",
+            )
+        except ImportError:
+            logger.debug("`pyarrow` is not installed. Using the default CSV engine.")
+            return pd.read_csv(path, usecols=_QUERY_SOURCE_COLUMNS)
+
+    @staticmethod
+    def _queries_from_titles(df: pd.DataFrame) -> Set[str]:
+        """Build search queries from the first three words of each page title."""
+        if "page_title" not in df:
+            return set()
+
+        titles = df["page_title"].fillna("").astype(str)
+        titles = titles.str.replace(_TITLE_PREFIX_RE, "", regex=True).str.strip()
+        titles = titles.str.replace(_NON_ALNUM_RE, "", regex=True).str.strip()
+        queries = titles.str.split().str[:3].str.join(" ")
+        return set(queries[queries.str.len() > 0])
 
     def _parse_page(self, content: str) -> List[ComicRow]:
         """Parses a single page of search results from its HTML content."""
-        tree = HTMLParser(content)
+        tree = LexborHTMLParser(content)
         results = []
 
-        for blockquote in tree.css("li > blockquote"):
-            link_node = blockquote.css_first("a.searchlink")
+        for blockquote in tree.css(self._SEL_RESULT):
+            link_node = blockquote.css_first(self._SEL_LINK)
             if not link_node:
                 continue
 
@@ -66,6 +138,11 @@ class OhNoRobotScraper:
                 continue
 
             normalized_url = self._normalize_smbc_url(url)
+            parsed_url = urlparse(normalized_url)
+            if parsed_url.scheme not in {"http", "https"} or not parsed_url.netloc:
+                logger.debug(f"Skipping result with non-http URL: {normalized_url}")
+                continue
+
             identifier = self._get_identifier_from_url(normalized_url)
             if not identifier:
                 logger.debug(
@@ -74,14 +151,16 @@ class OhNoRobotScraper:
                 )
                 continue
 
-            for selector in ["div.tinylink", "p"]:
+            for selector in self._SEL_REMOVE:
                 if node_to_remove := blockquote.css_first(selector):
                     node_to_remove.decompose()
 
             comic_text = blockquote.text(strip=True, separator="\n")
 
+            # Inputs are already checked above, so skip per-row validation
+            # on this hot path; the URL check mirrors ComicRow.validate_url.
             results.append(
-                ComicRow(
+                ComicRow.model_construct(
                     url=normalized_url,
                     slug=identifier,
                     comic_text=comic_text,
@@ -91,78 +170,137 @@ class OhNoRobotScraper:
         return results
 
     async def _run_queries(self, queries: List[str]) -> List[ComicRow]:
-        """The core worker to perform searches and scrape results."""
+        """
+        The core worker to perform searches and scrape results.
+
+        Up to ``query_concurrency`` queries are paginated at once, each
+        prefetching its next page while the current one is parsed.
+        """
         logger.info(f"Running {len(queries)} unique queries on OhNoRobot.")
-        all_comics: dict[str, ComicRow] = {}
+        sem = asyncio.Semaphore(self.query_concurrency)
 
         with Progress() as progress:
             task = progress.add_task("[cyan]Querying OhNoRobot...", total=len(queries))
 
-            for query in queries:
-                page = 0
-                seen_on_this_query: Set[str] = set()
-                while True:
-                    params = {"s": query, "comic": 137, "page": page}
-                    full_url = f"{self.BASE_URL}?{urlencode(params)}"
-                    logger.debug(f"GET {full_url}")
-
-                    response = await self.client.get(full_url)
-                    if not response or response.status_code != 200:
-                        logger.warning(
-                            "Failed to fetch page for query "
-                            f"'{query}', page {page}. "
-                            f"Status: {response.status_code if response else 'N/A'}"
-                        )
-                        break
-
-                    page_results = self._parse_page(response.text)
-                    if not page_results:
-                        logger.debug(f"No more results for '{query}' on page {page}.")
-                        break
-
-                    current_page_urls = {str(r.url) for r in page_results}
-                    if current_page_urls.issubset(seen_on_this_query):
-                        logger.debug(
-                            "Duplicate results for "
-                            f"'{query}' on page {page}, likely end of results. "
-                            "Stopping."
-                        )
-                        break
-
-                    for comic in page_results:
-                        comic_url = str(comic.url)
-                        if comic_url not in all_comics:
-                            all_comics[comic_url] = comic
-                        seen_on_this_query.add(comic_url)
-                    page += 1
+            async def bounded(query: str) -> dict[ComicKey, ComicRow]:
+                async with sem:
+                    query_comics = await self._paginate_query(query)
                 progress.update(task, advance=1)
+                return query_comics
+
+            per_query = await asyncio.gather(*(bounded(query) for query in queries))
+
+        # Merge in query order (not completion order) so a comic found by
+        # several queries always keeps the row from the first of them. Keyed
+        # on the (unique per identifier) sort key, so the final ordering is a
+        # plain key sort with no per-row key function.
+        all_comics: dict[ComicKey, ComicRow] = {}
+        for query_comics in per_query:
+            for key, comic in query_comics.items():
+                all_comics.setdefault(key, comic)
+        return [row for _, row in sorted(all_comics.items())]
+
+    async def _paginate_query(self, query: str) -> dict[ComicKey, ComicRow]:
+        """Walk every result page for *query* and return its rows by sort key."""
+
+        # Encode the query once; only the page number changes between requests.
+        url_prefix = f"{self.BASE_URL}?{urlencode({'s': query, 'comic': 137})}&page="
+
+        def fetch(page: int) -> asyncio.Task[Optional[httpx.Response]]:
+            full_url = url_prefix + str(page)
+            logger.debug("GET {}", full_url)
+            return asyncio.create_task(self.client.get(full_url))
+
+        page = 0
+        query_comics: dict[ComicKey, ComicRow] = {}
+        seen_on_this_query: Set[ComicKey] = set()
+        next_fetch = fetch(page)
+        try:
+            while True:
+                response = await next_fetch
+                # The paginator is deterministic, so request the following
+                # page while this one is parsed. A failed page ends the query,
+                # so it gets no prefetch.
+                if response is not None and response.status_code == 200:
+                    next_fetch = fetch(page + 1)
+                page_results = await self._parse_response(query, page, response)
+                if not page_results or not self._absorb_page(
+                    query, page, page_results, seen_on_this_query, query_comics
+                ):
+                    break
+                page += 1
+        finally:
+            # Abandon the prefetch past the last page; the client cancels the
+            # request itself if it has not been sent yet.
+            next_fetch.cancel()
+            await asyncio.gather(next_fetch, return_exceptions=True)
+        return query_comics
+
+    async def _parse_response(
+        self, query: str, page: int, response: Optional[httpx.Response]
+    ) -> List[ComicRow]:
+        """Parse one result page in a worker thread so fetches keep flowing."""
+        if not response or response.status_code != 200:
+            logger.warning(
+                "Failed to fetch page for query "
+                f"'{query}', page {page}. "
+                f"Status: {response.status_code if response else 'N/A'}"
+            )
+            return []
 
-        return sorted(all_comics.values(), key=self._sort_key)
+        # Decode with httpx's charset handling: selectolax reads raw bytes as
+        # UTF-8 and ignores both <meta charset> and the Content-Type header.
+        page_results = await asyncio.to_thread(self._parse_page, response.text)
+        if not page_results:
+            logger.debug(f"No more results for '{query}' on page {page}.")
+        return page_results
+
+    @classmethod
+    def _absorb_page(
+        cls,
+        query: str,
+        page: int,
+        page_results: List[ComicRow],
+        seen_on_this_query: Set[ComicKey],
+        query_comics: dict[ComicKey, ComicRow],
+    ) -> bool:
+        """Merge one result page into *query_comics*; return False once exhausted."""
+        page_keys = [cls._sort_key(row) for row in page_results]
+        if seen_on_this_query.issuperset(page_keys):
+            logger.debug(
+                "Duplicate results for "
+                f"'{query}' on page {page}, likely end of results. "
+                "Stopping."
+            )
+            return False
+
+        for key, comic in zip(page_keys, page_results):
+            query_comics.setdefault(key, comic)
+        seen_on_this_query.update(page_keys)
+        return True
 
     async def scrape(self, input_dir: Path, limit: int) -> List[ComicRow]:
         """
-        Generates search queries from existing CSV data and scrapes ohnorobot.com.
+        Generates search queries from existing exports and scrapes ohnorobot.com.
         """
         logger.info(
             "Starting OhNoRobot scrape, "
             f"generating queries from files in '{input_dir}'"
         )
 
-        smbc_csv_path = input_dir / "smbc_ground_truth.csv"
-        wiki_csv_path = input_dir / "smbc_wiki.csv"
-
         dfs = []
-        for path in [smbc_csv_path, wiki_csv_path]:
-            if path.exists():
+        for source_name in ["smbc_ground_truth", "smbc_wiki"]:
+            path = self._find_query_source(input_dir / source_name)
+            if path:
                 logger.debug(f"Loading data from {path}")
                 try:
-                    dfs.append(pd.read_csv(path))
+                    dfs.append(self._read_query_source(path))
                 except Exception as e:
                     logger.error(f"Failed to read {path}: {e}")
 
         if not dfs:
             logger.error(
-                f"No source CSV files found in '{input_dir}'. "
+                f"No source exports found in '{input_dir}'. "
                 "Cannot generate queries. Run 'smbc' or 'wiki' scrapers first."
             )
             return []
@@ -174,20 +312,8 @@ class OhNoRobotScraper:
             .reset_index(drop=True)
         )
 
-        queries = set()
         rows_to_process = combined_df.head(limit)
-
-        for _, row in rows_to_process.iterrows():
-            title = str(row.get("page_title", ""))
-            title = re.sub(
-                r"Saturday Morning Breakfast Cereal -?",
-                "",
-                title,
-                flags=re.IGNORECASE,
-            ).strip()
-            title = re.sub(r"[^a-zA-Z0-9\s]", "", title).strip()
-            if title and (query := " ".join(title.split()[:3])):
-                queries.add(query)
+        queries = self._queries_from_titles(rows_to_process)
 
         if not queries:
             logger.warning(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import re
 from dataclasses import dataclass
 from datetime import date
@@ -9,18 +10,27 @@ from pathlib import Path
 from typing import List, Optional, Tuple
 from urllib.parse import parse_qs, urljoin, urlparse
 
+import orjson
 from loguru import logger
 from rich.progress import Progress
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-from smbc_scraper.core.files import get_html_path, get_image_path
-from smbc_scraper.core.http import HttpGetClient
+from smbc_scraper.core.files import get_html_path, get_id_index_path, get_image_path
+from smbc_scraper.core.http import HttpDownloadClient
 from smbc_scraper.export import load_comics
 from smbc_scraper.models import ComicRow
 
 DEFAULT_INCREMENTAL_STATE_FILENAME = "smbc_ground_truth_state.json"
 
 
+def _existing_nonempty(path: Path) -> bool:
+    """True if *path* is a non-empty file; zero-byte leftovers count as missing."""
+    try:
+        return os.stat(path).st_size > 0
+    except FileNotFoundError:
+        return False
+
+
 @dataclass(frozen=True)
 class IncrementalScrapeState:
     last_scraped_id: int
@@ -78,10 +88,32 @@ class SmbcScraper:
     IMAGE_DATE_RE = re.compile(
         r"(?P<year>20\d{2})(?P<month>0[1-9]|1[0-2])(?P<day>0[1-9]|[12]\d|3[01])"
     )
+    # Combined selectors: each is one tree walk, keyed afterwards by tag/id.
+    _SEL_META = 'script[type="application/ld+json"], link[rel="canonical"], title'
+    _SEL_PANELS = "img#cc-comic, img#aftercomic"
+    # Containers searched, in order, when the page has no img#cc-comic.
+    _SEL_MAIN_FALLBACKS = ("div#comic img", "div#cc-comicbody img")
 
-    def __init__(self, http_client: HttpGetClient, data_dir: str):
+    def __init__(
+        self,
+        http_client: HttpDownloadClient,
+        data_dir: str,
+        html_concurrency: int = 32,
+        image_concurrency: int = 64,
+    ):
         self.client = http_client
         self.data_dir = Path(data_dir)
+        self.html_concurrency = html_concurrency
+        # Image downloads get their own budget so a slow image never holds a
+        # page slot (and vice versa).
+        self._image_sem = asyncio.Semaphore(image_concurrency)
+        self._created_dirs: set[Path] = set()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """mkdir -p *directory*, skipping the syscall for ones already created."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
 
     def _extract_legacy_id(self, url: str) -> Optional[int]:
         """
@@ -108,7 +140,7 @@ class SmbcScraper:
         parsed_url = urlparse(url)
         path = parsed_url.path.rstrip("/")
         if path and path != "/":
-            slug = path.split("/")[-1]
+            slug = path.rpartition("/")[2]
             if slug and slug != "index.php":
                 return slug
 
@@ -116,7 +148,7 @@ class SmbcScraper:
         if comic_ids := query_params.get("id"):
             return comic_ids[0]
 
-        return url.rstrip("/").rsplit("/", maxsplit=1)[-1]
+        return url.rstrip("/").rpartition("/")[2]
 
     async def rebuild_id_index_from_local_files(
         self, source_csv_path: Path, max_id: Optional[int] = None
@@ -130,10 +162,9 @@ class SmbcScraper:
         so they are fast and require no network access for already-scraped IDs.
         """
         existing_rows = load_comics(source_csv_path)
-        # Use mutable dicts so we can update legacy_id in place.
-        row_map: dict[str, dict] = {
-            row.slug: row.model_dump() for row in existing_rows
-        }
+        # Keep the validated rows themselves; only rows that gain a legacy_id
+        # are copied, instead of dumping and re-validating every row.
+        row_map: dict[str, ComicRow] = {row.slug: row for row in existing_rows}
 
         if not row_map:
             logger.warning("No existing rows found in CSV; nothing to rebuild.")
@@ -144,7 +175,7 @@ class SmbcScraper:
 
         # Only probe IDs for rows that still lack a legacy_id.
         slugs_missing_id = {
-            slug for slug, d in row_map.items() if d.get("legacy_id") is None
+            slug for slug, row in row_map.items() if row.legacy_id is None
         }
         if not slugs_missing_id:
             logger.info("All rows already have a legacy_id; nothing to rebuild.")
@@ -171,7 +202,9 @@ class SmbcScraper:
             for f in asyncio.as_completed(probe_futures):
                 comic_id, slug = await f
                 if slug and slug in slugs_missing_id:
-                    row_map[slug]["legacy_id"] = comic_id
+                    row_map[slug] = row_map[slug].model_copy(
+                        update={"legacy_id": comic_id}
+                    )
                     slugs_missing_id.discard(slug)
                     updated_count += 1
                 progress.update(task, advance=1)
@@ -182,7 +215,7 @@ class SmbcScraper:
                 f"{len(slugs_missing_id)} rows still have no legacy_id "
                 "(not found in the probed ID range)."
             )
-        return [ComicRow.model_validate(d) for d in row_map.values()]
+        return list(row_map.values())
 
     async def _resolve_truly_missing_ids(
         self, candidate_ids: List[int], existing_slugs: set[str]
@@ -296,42 +329,42 @@ class SmbcScraper:
 
     async def _download_image(self, url: str, path: Path) -> bool:
         """Downloads a single image to the specified path."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        if path.exists():
-            logger.trace(f"Image already exists, skipping: {path}")
+        if _existing_nonempty(path):
+            logger.trace("Image already exists, skipping: {}", path)
             return True
 
-        logger.debug(f"Attempting to download image from URL: {url}")
-        response = await self.client.get(url)
-        if response and response.status_code == 200:
-            try:
-                path.write_bytes(response.content)
-                logger.debug(f"Successfully downloaded image to {path}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to write image {url} to {path}: {e}")
-        else:
-            logger.warning(
-                "Failed to fetch image "
-                f"{url}. Status: {response.status_code if response else 'N/A'}"
-            )
+        self._ensure_dir(path.parent)
 
-        return False
+        async with self._image_sem:
+            logger.debug("Attempting to download image from URL: {}", url)
+            downloaded = await self.client.download(url, path)
+
+        if downloaded:
+            logger.debug("Successfully downloaded image to {}", path)
+        return downloaded
 
     def _parse_page(  # noqa: C901
         self, url: str, content: str, legacy_id: Optional[int] = None
     ) -> Tuple[Optional[ComicRow], List[Tuple[str, Path]]]:
         """Parses the HTML of a single comic page to extract data and image URLs."""
-        tree = HTMLParser(content)
+        tree = LexborHTMLParser(content)
+
+        # First match of each kind, in document order: script, link, title.
+        meta_nodes: dict[Optional[str], LexborNode] = {}
+        for node in tree.css(self._SEL_META):
+            meta_nodes.setdefault(node.tag, node)
+        panel_nodes: dict[Optional[str], LexborNode] = {}
+        for node in tree.css(self._SEL_PANELS):
+            panel_nodes.setdefault(node.attributes.get("id"), node)
 
         # --- NEW STRATEGY: Prioritize JSON-LD for metadata ---
         comic_date: Optional[date] = None
         canonical_url: str = url
 
-        json_ld_node = tree.css_first('script[type="application/ld+json"]')
+        json_ld_node = meta_nodes.get("script")
         if json_ld_node:
             try:
-                json_data = json.loads(json_ld_node.text())
+                json_data = orjson.loads(json_ld_node.text())
                 if "datePublished" in json_data:
                     # Parse YYYY-MM-DD from the ISO timestamp
                     comic_date = date.fromisoformat(
@@ -339,7 +372,7 @@ class SmbcScraper:
                     )
                 if "url" in json_data:
                     canonical_url = json_data["url"]
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
+            except (orjson.JSONDecodeError, KeyError, ValueError) as e:
                 logger.warning(
                     f"Could not fully parse JSON-LD for {url}. "
                     f"Will fallback. Error: {e}"
@@ -347,27 +380,21 @@ class SmbcScraper:
 
         # --- FALLBACK STRATEGY: Use canonical link and slug ---
         if canonical_url == url:  # If JSON-LD didn't provide a URL
-            canonical_url_node = tree.css_first('link[rel="canonical"]')
+            canonical_url_node = meta_nodes.get("link")
             if canonical_url_node:
                 canonical_url = canonical_url_node.attributes.get("href") or url
 
         slug = self._extract_slug(canonical_url)
 
-        page_title_node = tree.css_first("title")
+        page_title_node = meta_nodes.get("title")
 
         # 2. Find main comic image and its hover text (with fallbacks)
-        main_comic_node = tree.css_first("img#cc-comic")  # Original, most specific
-        if not main_comic_node:
-            # Fallback 1: Look for any image inside the main comic div
-            comic_div = tree.css_first("div#comic")
-            if comic_div:
-                main_comic_node = comic_div.css_first("img")
-
-        if not main_comic_node:
-            # Fallback 2: Look in another known container
-            comic_body_div = tree.css_first("div#cc-comicbody")
-            if comic_body_div:
-                main_comic_node = comic_body_div.css_first("img")
+        main_comic_node = panel_nodes.get("cc-comic")  # Original, most specific
+        for fallback_selector in self._SEL_MAIN_FALLBACKS:
+            if main_comic_node:
+                break
+            # Any image inside the main comic div, then the comic body div
+            main_comic_node = tree.css_first(fallback_selector)
 
         if not main_comic_node:
             logger.warning(
@@ -400,7 +427,7 @@ class SmbcScraper:
             )
 
         # 3. Find 'votey' bonus image and its text
-        votey_node = tree.css_first("img#aftercomic")
+        votey_node = panel_nodes.get("aftercomic")
         votey_text = None
         votey_url = None
         if votey_node:
@@ -438,10 +465,56 @@ class SmbcScraper:
             if votey_image_path:
                 images_to_download.append((full_votey_url, votey_image_path))
 
-        return row, images_to_download
+        # Guard against the same (url, path) being queued twice, which would
+        # fetch it twice and race on the same .part file.
+        return row, list(dict.fromkeys(images_to_download))
+
+    def _load_scraped_comic(self, comic_id: int) -> Optional[ComicRow]:
+        """
+        Return the row recorded by a previous complete scrape of *comic_id*.
+
+        Only used when the sidecar, the saved HTML and every image it lists are
+        still on disk; otherwise the comic is scraped again.
+        """
+        index_path = get_id_index_path(self.data_dir, comic_id)
+        if not index_path.exists():
+            return None
+
+        try:
+            payload = json.loads(index_path.read_text(encoding="utf-8"))
+            row = ComicRow.model_validate(payload["row"])
+            image_paths = [self.data_dir / image for image in payload["images"]]
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable sidecar {index_path}: {e}")
+            return None
+
+        if not get_html_path(self.data_dir, row).exists():
+            return None
+        if not all(_existing_nonempty(path) for path in image_paths):
+            return None
+        return row
+
+    def _save_scraped_comic(
+        self, comic_id: int, row: ComicRow, image_paths: List[Path]
+    ) -> None:
+        """Record a complete scrape so later runs can skip the HTTP round trip."""
+        index_path = get_id_index_path(self.data_dir, comic_id)
+        self._ensure_dir(index_path.parent)
+        payload = {
+            "row": row.model_dump(mode="json"),
+            "images": [
+                path.relative_to(self.data_dir).as_posix() for path in image_paths
+            ],
+        }
+        index_path.write_text(json.dumps(payload) + "\n", encoding="utf-8")
 
     async def _scrape_one_comic(self, comic_id: int) -> Optional[ComicRow]:
         """Scrapes a single comic page by its ID, handling redirects."""
+        # The sidecar check stats several files; keep it off the event loop.
+        if cached_row := await asyncio.to_thread(self._load_scraped_comic, comic_id):
+            logger.trace("Comic ID {} already on disk, skipping fetch.", comic_id)
+            return cached_row
+
         url = f"https://www.smbc-comics.com/index.php?db=comics&id={comic_id}"
         response = await self.client.get(url)
 
@@ -456,9 +529,10 @@ class SmbcScraper:
         final_url = str(response.url)
 
         # Parse the final page content to get the comic row with its canonical
-        # date and slug.
-        comic_row, images_to_download = self._parse_page(
-            final_url, response.text, legacy_id=comic_id
+        # date and slug. Parsing runs in a worker thread so other in-flight
+        # pages keep making progress on the event loop.
+        comic_row, images_to_download = await asyncio.to_thread(
+            self._parse_page, final_url, response.text, legacy_id=comic_id
         )
 
         if not comic_row:
@@ -466,13 +540,15 @@ class SmbcScraper:
 
         # Now that we have a valid comic_row, save the raw HTML for auditability
         html_path = get_html_path(self.data_dir, comic_row)
-        html_path.parent.mkdir(parents=True, exist_ok=True)
-        html_path.write_text(response.text, encoding="utf-8")
+        self._ensure_dir(html_path.parent)
+        # Write off the event loop so a slow disk does not stall other pages.
+        await asyncio.to_thread(html_path.write_bytes, response.text.encode("utf-8"))
 
         # Concurrently download images for this page
         download_tasks = [
             self._download_image(img_url, path) for img_url, path in images_to_download
         ]
+        failed_downloads = 0
         if download_tasks:
             download_results = await asyncio.gather(*download_tasks)
             failed_downloads = sum(not result for result in download_results)
@@ -482,6 +558,14 @@ class SmbcScraper:
                     f"{failed_downloads} failed image download(s)."
                 )
 
+        if not failed_downloads:
+            await asyncio.to_thread(
+                self._save_scraped_comic,
+                comic_id,
+                comic_row,
+                [path for _, path in images_to_download],
+            )
+
         return comic_row
 
     async def _get_row_for_legacy_id(self, comic_id: int) -> Optional[ComicRow]:
@@ -496,8 +580,8 @@ class SmbcScraper:
             )
             return None
 
-        comic_row, _ = self._parse_page(
-            str(response.url), response.text, legacy_id=comic_id
+        comic_row, _ = await asyncio.to_thread(
+            self._parse_page, str(response.url), response.text, legacy_id=comic_id
         )
         return comic_row
 
@@ -581,32 +665,32 @@ class SmbcScraper:
         logger.info(f"Starting SMBC ground-truth scrape from ID {start_id} to {end_id}")
 
         ids_to_scrape = range(start_id, end_id + 1)
-        results: List[ComicRow] = []
 
         with Progress() as progress:
             task = progress.add_task(
                 "[cyan]Scraping smbc-comics.com by ID...", total=len(ids_to_scrape)
             )
 
-            sem = asyncio.Semaphore(8)
+            # A fixed pool of workers shares one iterator over the range, so
+            # only `html_concurrency` coroutines exist however large the range is.
+            pending_ids = iter(ids_to_scrape)
+            # Slot each row by its offset in the range so results come out in
+            # ID order regardless of completion order.
+            slots: List[Optional[ComicRow]] = [None] * len(ids_to_scrape)
 
-            async def bounded(fn, *a, **kw):
-                async with sem:
-                    return await fn(*a, **kw)
+            async def worker() -> None:
+                for comic_id in pending_ids:
+                    slots[comic_id - start_id] = await self._scrape_one_comic(comic_id)
+                    progress.update(task, advance=1)
 
-            scrape_tasks = [bounded(self._scrape_one_comic, i) for i in ids_to_scrape]
-            # scrape_tasks = [
-            #     self._scrape_one_comic(comic_id) for comic_id in ids_to_scrape
-            # ]
-
-            for f in asyncio.as_completed(scrape_tasks):
-                result = await f
-                if result:
-                    results.append(result)
-                progress.update(task, advance=1)
+            worker_count = min(self.html_concurrency, len(ids_to_scrape))
+            await asyncio.gather(*(worker() for _ in range(worker_count)))
 
+        results = [row for row in slots if row is not None]
         logger.info(f"Scrape complete. Found {len(results)} comics in the ID range.")
-        return sorted(results, key=lambda r: r.date if r.date else date.min)
+        # IDs are nearly chronological, so this sort is close to a single
+        # linear pass, and equal dates keep a stable ID order.
+        return sorted(results, key=lambda r: r.date or date.min)
 
     async def scrape_incremental(
         self,
@@ -662,8 +746,11 @@ class SmbcScraper:
             )
             return 0
 
-        parsed_row, images_to_download = self._parse_page(
-            str(response.url), response.text, legacy_id=row.legacy_id
+        parsed_row, images_to_download = await asyncio.to_thread(
+            self._parse_page,
+            str(response.url),
+            response.text,
+            legacy_id=row.legacy_id,
         )
         if not parsed_row:
             logger.warning(
@@ -675,7 +762,7 @@ class SmbcScraper:
             images_to_download = [
                 (image_url, image_path)
                 for image_url, image_path in images_to_download
-                if not image_path.exists()
+                if not _existing_nonempty(image_path)
             ]
 
         if not images_to_download:
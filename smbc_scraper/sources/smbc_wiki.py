@@ -1,75 +1,94 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import re
 from typing import List, Optional
 from urllib.parse import urlencode
 
+import orjson
 from loguru import logger
 from rich.progress import Progress
 
 from smbc_scraper.core.http import HttpGetClient
 from smbc_scraper.models import ComicRow
 
+_SMBC_COMIC_URL = (
+    r"https?://www\.smbc-comics\.com/(?:comic/[\w-]+|index\.php\?[\w=&;-]+)"
+)
+# Modern (/comic/slug) or legacy (index.php?...) URLs, most specific first.
+_URL_RES = (
+    # 1. Explicit URL in a comic template: {{Comic|...|url=...}}
+    re.compile(rf"\|\s*url\s*=\s*({_SMBC_COMIC_URL})"),
+    # 2. Fallback: any standalone SMBC comic URL.
+    re.compile(rf"({_SMBC_COMIC_URL})"),
+)
+_TITLE_SLUG_RE = re.compile(
+    r"\{\{comic.*?\|\s*title\s*=\s*([\w-]+)", re.DOTALL | re.IGNORECASE
+)
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_REDIRECT_RE = re.compile(r"#REDIRECT\s*\[\[(.*?)\]\]", re.IGNORECASE)
+_TEMPLATE_RE = re.compile(r"\{\{.*?\}\}")
+_BOLD_RE = re.compile(r"'''(.*?)'''")
+_ITALIC_RE = re.compile(r"''(.*?)''")
+_SECTION_RES: dict[str, re.Pattern[str]] = {}
+
+
+def _section_re(section_name: str) -> re.Pattern[str]:
+    """Return the (cached) pattern capturing a named wikitext section."""
+    pattern = _SECTION_RES.get(section_name)
+    if pattern is None:
+        # Capture the section until the next same-or-higher-level header.
+        pattern = _SECTION_RES[section_name] = re.compile(
+            rf"==\s*{section_name}\s*==\n(.*?)(?=\n==[^=]|\Z)",
+            re.DOTALL | re.IGNORECASE,
+        )
+    return pattern
+
 
 class SmbcWikiScraper:
     """Scrapes comic transcripts from the smbc-wiki.com MediaWiki API by ID."""
 
     API_URL = "https://www.smbc-wiki.com/api.php"
 
-    def __init__(self, http_client: HttpGetClient):
+    def __init__(self, http_client: HttpGetClient, concurrency: int = 32):
         self.client = http_client
+        self.concurrency = concurrency
 
     def _extract_section(self, wikitext: str, section_name: str) -> Optional[str]:
         """Extracts text from a specific wikitext section (e.g., ==Transcript==)."""
-        logger.trace(f"Attempting to extract section: '{section_name}'")
-        # Capture the named section until the next same-or-higher-level header.
-        pattern = re.compile(
-            rf"==\s*{section_name}\s*==\n(.*?)(?=\n==[^=]|\Z)",
-            re.DOTALL | re.IGNORECASE,
-        )
-        match = pattern.search(wikitext)
+        logger.trace("Attempting to extract section: '{}'", section_name)
+        match = _section_re(section_name).search(wikitext)
         if match:
             # Clean up wikitext markup (e.g., {{...}}, ''', '''')
             text = match.group(1).strip()
-            text = re.sub(r"\{\{.*?\}\}", "", text)
-            text = re.sub(r"'''(.*?)'''", r"\1", text)
-            text = re.sub(r"''(.*?)''", r"\1", text)
-            logger.trace(f"Extracted section '{section_name}' successfully.")
+            text = _TEMPLATE_RE.sub("", text)
+            text = _BOLD_RE.sub(r"\1", text)
+            text = _ITALIC_RE.sub(r"\1", text)
+            logger.trace("Extracted section '{}' successfully.", section_name)
             return text
 
-        logger.trace(f"Section '{section_name}' not found in wikitext.")
+        logger.trace("Section '{}' not found in wikitext.", section_name)
         return None
 
     def _extract_smbc_url(self, wikitext: str) -> Optional[str]:
         """Finds or constructs the original smbc-comics.com URL from the wikitext."""
-        # Look for either modern (/comic/slug) or legacy (index.php?...) URLs.
-        # It tries a more specific pattern (inside a template) first.
-        explicit_url_patterns = [
-            # 1. Look for explicit URL in a comic template: {{Comic|...|url=...}}
-            # It captures either URL format.
-            r"\|\s*url\s*=\s*(https?://www\.smbc-comics\.com/(?:comic/[\w-]+|index\.php\?[\w=&;-]+))",
-            # 2. Fallback: Look for any standalone SMBC comic URL.
-            r"(https?://www\.smbc-comics\.com/(?:comic/[\w-]+|index\.php\?[\w=&;-]+))",
-        ]
-
-        for pattern in explicit_url_patterns:
-            match = re.search(pattern, wikitext)
+        for pattern in _URL_RES:
+            match = pattern.search(wikitext)
             if match:
                 url = match.group(1).strip()
                 logger.trace(
-                    f"Found explicit SMBC URL '{url}' using pattern: '{pattern}'"
+                    "Found explicit SMBC URL '{}' using pattern: '{}'",
+                    url,
+                    pattern.pattern,
                 )
                 return url
 
         # Fallback: construct the URL from the |title= field in {{comic}}.
-        title_slug_pattern = r"\{\{comic.*?\|\s*title\s*=\s*([\w-]+)"
-        match = re.search(title_slug_pattern, wikitext, re.DOTALL | re.IGNORECASE)
+        match = _TITLE_SLUG_RE.search(wikitext)
         if match:
             slug = match.group(1).strip()
             # Ignore plain numeric IDs here; they are not modern comic slugs.
-            if re.match(r"^\d{4}-\d{2}-\d{2}$", slug) or not slug.isdigit():
+            if _ISO_DATE_RE.match(slug) or not slug.isdigit():
                 url = f"https://www.smbc-comics.com/comic/{slug}"
                 logger.info(
                     f"Constructed SMBC URL '{url}' from wiki template title field."
@@ -98,7 +117,7 @@ class SmbcWikiScraper:
             "format": "json",
         }
         full_url = f"{self.API_URL}?{urlencode(params)}"
-        logger.debug(f"GET {full_url}")
+        logger.debug("GET {}", full_url)
 
         response = await self.client.get(full_url)
         if not response or response.status_code != 200:
@@ -106,9 +125,9 @@ class SmbcWikiScraper:
 
         try:
             logger.trace(
-                f"Response body for page '{page_title_or_id}':\n{response.text}"
+                "Response body for page '{}':\n{}", page_title_or_id, response.text
             )
-            data = response.json()
+            data = orjson.loads(response.content)
             if "error" in data and data["error"]["code"] == "missingtitle":
                 logger.debug(f"No wiki page found for title/ID '{page_title_or_id}'")
                 return None
@@ -116,9 +135,7 @@ class SmbcWikiScraper:
             wikitext = data["parse"]["wikitext"]["*"]
 
             # Handle redirects
-            redirect_match = re.match(
-                r"#REDIRECT\s*\[\[(.*?)\]\]", wikitext, re.IGNORECASE
-            )
+            redirect_match = _REDIRECT_RE.match(wikitext)
             if redirect_match:
                 new_page_title = redirect_match.group(1).strip()
                 logger.info(
@@ -140,7 +157,7 @@ class SmbcWikiScraper:
 
             # Generate slug based on URL format
             if "/comic/" in url:
-                slug = url.split("/")[-1]
+                slug = url.rpartition("/")[2]
             else:
                 slug = str(
                     original_id
@@ -157,7 +174,7 @@ class SmbcWikiScraper:
                 votey_text=votey_text,
                 source="smbc-wiki",
             )
-        except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+        except (KeyError, IndexError, TypeError, orjson.JSONDecodeError) as e:
             logger.error(
                 "Failed to parse wiki JSON for page "
                 f"'{page_title_or_id}' (from ID {original_id}). Error: {e}"
@@ -172,37 +189,29 @@ class SmbcWikiScraper:
         logger.info(f"Starting SMBC-Wiki scrape from ID {start_id} to {end_id}")
 
         ids_to_scrape = range(start_id, end_id + 1)
-        results: List[ComicRow] = []
 
         with Progress() as progress:
             task = progress.add_task(
                 "[cyan]Scraping SMBC-Wiki by ID...", total=len(ids_to_scrape)
             )
 
-            sem = asyncio.Semaphore(8)
+            # A fixed pool of workers shares one iterator over the range, so
+            # only `concurrency` coroutines exist however large the range is.
+            pending_ids = iter(ids_to_scrape)
+            # Slot each row by its offset in the range so the final sort sees
+            # a deterministic (ID-ordered) input regardless of completion order.
+            slots: List[Optional[ComicRow]] = [None] * len(ids_to_scrape)
 
-            async def bounded(fn, *a, **kw):
-                async with sem:
-                    return await fn(*a, **kw)
+            async def worker() -> None:
+                for comic_id in pending_ids:
+                    slots[comic_id - start_id] = await self._fetch_and_parse_page(
+                        page_title_or_id=str(comic_id), original_id=comic_id
+                    )
+                    progress.update(task, advance=1)
 
-            scrape_tasks = [
-                bounded(
-                    self._fetch_and_parse_page,
-                    page_title_or_id=str(comic_id),
-                    original_id=comic_id,
-                )
-                for comic_id in ids_to_scrape
-            ]
-            # scrape_tasks = [
-            #     self._fetch_and_parse_page(str(comic_id), original_id=comic_id)
-            #     for comic_id in ids_to_scrape
-            # ]
-
-            for f in asyncio.as_completed(scrape_tasks):
-                result = await f
-                if result:
-                    results.append(result)
-                progress.update(task, advance=1)
+            worker_count = min(self.concurrency, len(ids_to_scrape))
+            await asyncio.gather(*(worker() for _ in range(worker_count)))
 
+        results = [row for row in slots if row is not None]
         logger.info(f"SMBC-Wiki scrape complete. Parsed {len(results)} pages.")
         return sorted(results, key=lambda r: r.slug)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import Iterable
@@ -11,10 +13,100 @@ from loguru import logger
 from smbc_scraper.export import save_comics
 from smbc_scraper.models import ComicRow
 
-FRONT_MATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+FRONT_MATTER_DELIMITER = "---"
+MARKDOWN_SUFFIXES = (".md", ".markdown")
 DATE_IN_URL_RE = re.compile(
     r"(?P<year>20\d{2})(?P<month>0[1-9]|1[0-2])(?P<day>[0-2][0-9]|3[01])"
 )
+# Below this many files, process start-up costs more than parsing serially.
+PARALLEL_PARSE_MIN_FILES = 128
+PARALLEL_PARSE_CHUNKSIZE = 64
+# Value prefixes that mean YAML syntax (flow collections, block scalars,
+# anchors, tags, ...) which the flat front-matter parser does not handle.
+_YAML_SYNTAX_PREFIXES = tuple("[{|>&*!%@`")
+_YAML_NULLS = frozenset({"~", "null", "Null", "NULL"})
+
+
+def _parse_flat_front_matter(front_matter_raw: str) -> dict | None:
+    """Parse front matter made only of single-line ``key: value`` pairs.
+
+    Values are kept as strings (quotes removed). Returns None as soon as the
+    block uses anything richer, so the caller can fall back to a YAML load.
+    """
+    fm: dict = {}
+    for line in front_matter_raw.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if line[0].isspace() or line[0] in "-'\"":
+            return None
+
+        key, sep, value = line.partition(":")
+        key = key.strip()
+        value = value.strip()
+        if not sep or not key:
+            return None
+        if not value or value in _YAML_NULLS:
+            fm[key] = None
+            continue
+        if value.startswith(_YAML_SYNTAX_PREFIXES) or " #" in value:
+            return None
+
+        unquoted = _unquote_flat_value(value)
+        if unquoted is None:
+            return None
+        fm[key] = unquoted
+    return fm
+
+
+def _unquote_flat_value(value: str) -> str | None:
+    """Strip YAML quotes from a one-line scalar.
+
+    Returns None for quoting the flat parser does not handle (escapes,
+    unterminated or embedded quotes), so the caller falls back to YAML.
+    """
+    quote = value[0]
+    if quote not in "'\"":
+        return value
+    if len(value) < 2 or value[-1] != quote or "\\" in value:
+        return None
+    inner = value[1:-1]
+    if quote == "'":
+        return inner.replace("''", "'")
+    if '"' in inner:
+        return None
+    return inner
+
+
+def _split_front_matter(markdown_text: str) -> tuple[str, str] | None:
+    """Return (front_matter_raw, body) if *markdown_text* opens with front matter.
+
+    The block runs from a leading '---' line to the next '---' line (trailing
+    whitespace allowed on both). Plain string scans are enough for a literal
+    delimiter and never touch the body of files without front matter.
+    """
+    if not markdown_text.startswith(FRONT_MATTER_DELIMITER):
+        return None
+    open_end = markdown_text.find("\n", len(FRONT_MATTER_DELIMITER))
+    if open_end == -1 or markdown_text[len(FRONT_MATTER_DELIMITER) : open_end].strip():
+        return None
+
+    closing = "\n" + FRONT_MATTER_DELIMITER
+    search_from = open_end
+    while (close := markdown_text.find(closing, search_from)) != -1:
+        line_start = close + len(closing)
+        line_end = markdown_text.find("\n", line_start)
+        if line_end == -1:
+            return None
+        if not markdown_text[line_start:line_end].strip():
+            return markdown_text[open_end + 1 : close], markdown_text[line_end + 1 :]
+        search_from = line_start
+    return None
 
 
 def _extract_front_matter(markdown_text: str) -> tuple[dict, str]:
@@ -22,13 +114,17 @@ def _extract_front_matter(markdown_text: str) -> tuple[dict, str]:
 
     If no front matter is present, returns ({}, original_text).
     """
-    match = FRONT_MATTER_RE.match(markdown_text)
-    if not match:
+    split = _split_front_matter(markdown_text)
+    if split is None:
         return {}, markdown_text
 
-    front_matter_raw = match.group(1)
+    front_matter_raw, body = split
+    flat_fm = _parse_flat_front_matter(front_matter_raw)
+    if flat_fm is not None:
+        return flat_fm, body
+
     try:
-        fm: dict = yaml.safe_load(front_matter_raw) or {}
+        fm: dict = yaml.load(front_matter_raw, Loader=_YamlLoader) or {}
         if not isinstance(fm, dict):
             logger.warning("Front matter parsed to non-dict; ignoring.")
             fm = {}
@@ -36,7 +132,6 @@ def _extract_front_matter(markdown_text: str) -> tuple[dict, str]:
         logger.error(f"Failed to parse front matter YAML: {exc}")
         fm = {}
 
-    body = markdown_text[match.end() :]
     return fm, body
 
 
@@ -117,25 +212,52 @@ def parse_markdown_file(path: Path) -> ComicRow:
 
 
 def iter_markdown_files(root: Path) -> Iterable[Path]:
-    """Yield all markdown files under root (recursively)."""
-    yield from root.rglob("*.md")
-    yield from root.rglob("*.markdown")
+    """Yield all markdown files under root (recursively).
+
+    A single os.scandir walk covers both extensions and reuses the cached
+    directory-entry type instead of stat-ing every path.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(MARKDOWN_SUFFIXES) and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as exc:
+            logger.warning(f"Skipping unreadable directory: {exc}")
+
+
+def _parse_markdown_file_or_none(path: Path) -> ComicRow | None:
+    """Parse *path*, logging and returning None instead of raising."""
+    try:
+        return parse_markdown_file(path)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception(f"Failed to parse {path}: {exc}")
+        return None
 
 
 def load_rows_from_folder(folder: Path) -> list[ComicRow]:
-    """Parse all markdown files in *folder* into ComicRow objects."""
+    """Parse all markdown files in *folder* into ComicRow objects.
+
+    Large folders are parsed across CPU cores; small ones stay in-process.
+    """
     files = list(iter_markdown_files(folder))
     if not files:
         logger.warning(f"No markdown files found under {folder}")
         return []
 
-    rows: list[ComicRow] = []
-    for fp in files:
-        try:
-            rows.append(parse_markdown_file(fp))
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.exception(f"Failed to parse {fp}: {exc}")
-    return rows
+    if len(files) < PARALLEL_PARSE_MIN_FILES:
+        parsed = map(_parse_markdown_file_or_none, files)
+        return [row for row in parsed if row is not None]
+
+    with ProcessPoolExecutor() as executor:
+        parsed_in_pool = executor.map(
+            _parse_markdown_file_or_none, files, chunksize=PARALLEL_PARSE_CHUNKSIZE
+        )
+        return [row for row in parsed_in_pool if row is not None]
 
 
 def run_export(input_dir: Path, out_dir: Path = Path("./out")) -> None:
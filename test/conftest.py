@@ -0,0 +1,63 @@
+import importlib.util
+import socket
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from smbc_scraper.core.http import HttpClient
+
+# uvloop is not installed on Windows, where it is unsupported.
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "network: hits real HTTP endpoints")
+
+
+if HAS_UVLOOP:
+    import uvloop
+
+    def pytest_asyncio_loop_factories(config: pytest.Config, item: pytest.Item):
+        """Run async tests and fixtures on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+# Hosts the network-marked tests talk to.
+LIVE_HOSTS = ("httpbin.org", "www.smbc-comics.com")
+
+
+@pytest.fixture(scope="session")
+def warm_dns() -> None:
+    """Resolve the live test hosts once, up front, for network-marked tests.
+
+    Lookup failures are ignored here; the tests themselves report them.
+    """
+    for host in LIVE_HOSTS:
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+
+
+def _httpbin_like(request: httpx.Request) -> httpx.Response:
+    """Serves httpbin-style routes in-process: /get and /status/<code>."""
+    path = request.url.path
+    if path.startswith("/get"):
+        return httpx.Response(200, json={"headers": dict(request.headers)})
+    if path.startswith("/status/"):
+        return httpx.Response(int(path.rsplit("/", 1)[1]))
+    return httpx.Response(404)
+
+
+@pytest.fixture(scope="session")
+def mock_transport() -> httpx.MockTransport:
+    """One in-process transport shared by every HttpClient built in the session."""
+    return httpx.MockTransport(_httpbin_like)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(mock_transport: httpx.MockTransport):
+    """One HttpClient shared by the whole session, closed once at the end."""
+    async with HttpClient(rate_limit=1000.0, transport=mock_transport) as http_client:
+        yield http_client
@@ -95,6 +95,28 @@ class TestGetImagePath:
         result_path = get_image_path(tmp_path, comic_row_with_date, image_url)
         assert result_path == expected_path
 
+    @pytest.mark.parametrize(
+        ("image_url", "expected_name"),
+        [
+            ("https://www.smbc-comics.com/comics/1.gif?v=1.2", "2025-09-13-main.gif"),
+            ("https://www.smbc-comics.com/comics/1.jpg#frag", "2025-09-13-main.jpg"),
+            ("https://cdn.example.com", "2025-09-13-main.png"),
+        ],
+    )
+    def test_get_image_path_extension_ignores_query_and_host(
+        self,
+        tmp_path: Path,
+        comic_row_with_date: ComicRow,
+        image_url: str,
+        expected_name: str,
+    ):
+        """
+        Verifies the extension comes from the last path segment only, never from
+        the query string, fragment, or a bare host name.
+        """
+        result_path = get_image_path(tmp_path, comic_row_with_date, image_url)
+        assert result_path == tmp_path / "images" / "2025" / "09" / "13" / expected_name
+
     def test_get_image_path_uses_misc_fallback_if_no_date(
         self, tmp_path: Path, comic_row_no_date: ComicRow
     ):
@@ -1,99 +1,340 @@
 # tests/core/test_http.py
 
-import time
+import asyncio
+from email.utils import formatdate
 from pathlib import Path
 
+import httpx
 import pytest
+from tenacity import wait_none
 
-from smbc_scraper.core.http import HttpClient
+from smbc_scraper.core.http import HttpClient, RateLimiter, open_cache_db
 
-# All tests in this module are marked as asyncio
-pytestmark = pytest.mark.asyncio
 
+class FakeClock:
+    """Stands in for ``asyncio.sleep`` and the loop's ``time``.
 
+    Sleeping adds the delay to the clock instead of waiting, and the clock
+    only moves when something sleeps.
+    """
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self._real_sleep = asyncio.sleep
+
+    def time(self) -> float:
+        return self.elapsed
+
+    async def sleep(self, delay: float, result=None):
+        self.elapsed += delay
+        return await self._real_sleep(0, result)
+
+
+class CountingHandler:
+    """Mock transport handler that answers every request with one status code."""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        return httpx.Response(self.status_code)
+
+
+@pytest.fixture(scope="module")
+def shared_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """On-disk cache directory created once for the tests that need a real one."""
+    return tmp_path_factory.mktemp("http_cache")
+
+
+@pytest.mark.asyncio
 class TestHttpClient:
-    """Tests for the HttpClient class, making real network calls."""
+    """Tests for the HttpClient class, served by an in-process mock transport."""
 
-    async def test_successful_get_with_custom_user_agent(self, tmp_path: Path):
+    async def test_parallel_endpoints(self, client: HttpClient):
         """
-        Verifies a successful GET request and checks if the custom User-Agent is sent.
+        Verifies independent GETs run concurrently on the shared client: a
+        successful one that sends the custom User-Agent, and a 404.
         """
-        cache_dir = tmp_path / "test_cache"
-        client = HttpClient(cache_dir=str(cache_dir))
-        try:
-            # httpbin.org/get reflects the request headers in its response
-            response = await client.get("https://httpbin.org/get")
-            assert response is not None
-            assert response.status_code == 200
+        ok, missing = await asyncio.gather(
+            client.get("http://mock/get"), client.get("http://mock/status/404")
+        )
 
-            data = response.json()
-            assert data["headers"]["User-Agent"] == "SMBC-Scraper/1.0"
-        finally:
-            await client.close()
+        # /get reflects the request headers in its response
+        assert ok is not None
+        assert ok.status_code == 200
+        assert ok.json()["headers"]["user-agent"] == "SMBC-Scraper/1.0"
+
+        assert missing is not None
+        assert missing.status_code == 404
 
-    async def test_rate_limiter_enforces_delay(self, tmp_path: Path):
+    async def test_rate_limiter_enforces_delay(
+        self, monkeypatch: pytest.MonkeyPatch, mock_transport: httpx.MockTransport
+    ):
         """
         Verifies that the rate limiter correctly waits between requests.
         """
+        clock = FakeClock()
+        monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+        monkeypatch.setattr(asyncio.get_running_loop(), "time", clock.time)
         # A rate of 2 requests/sec means a period of 0.5 seconds between requests
-        client = HttpClient(cache_dir=str(tmp_path), rate_limit=2.0)
-
-        start_time = time.monotonic()
-        try:
-            # Make two requests back-to-back
-            await client.get("https://httpbin.org/get")
-            await client.get("https://httpbin.org/get")
-        finally:
-            await client.close()
+        async with HttpClient(rate_limit=2.0, transport=mock_transport) as client:
+            # Make two requests back-to-back.
+            await client.get("http://mock/get?n=1")
+            await client.get("http://mock/get?n=2")
 
-        duration = time.monotonic() - start_time
+        # The first request spends the initial token; no fake time passes
+        # between the calls, so the second waits out exactly one period.
+        assert clock.elapsed == 0.5
 
-        # The total time should be at least the period of the rate limit
-        # due to the enforced wait after the first request.
-        # Allowing for a small margin of error.
-        assert duration > 0.49
-
-
-    async def test_no_retry_on_4xx_client_error(self, tmp_path: Path, caplog):
+    @pytest.mark.parametrize("status_code", [400, 401, 404, 405, 410, 422])
+    async def test_no_retry_on_4xx_client_error(self, status_code: int):
         """
         Verifies that the client does NOT retry on a standard 4xx error (e.g., 404).
         """
-        client = HttpClient(cache_dir=str(tmp_path))
-        try:
-            # httpbin.org/status/404 consistently returns a 404 Not Found error
-            response = await client.get("https://httpbin.org/status/404")
+        handler = CountingHandler(status_code)
+        async with HttpClient(transport=httpx.MockTransport(handler)) as client:
+            response = await client.get(f"http://mock/status/{status_code}")
 
-            # It should return the response immediately without retrying
-            assert response is not None
-            assert response.status_code == 404
+        # It should return the response immediately without retrying
+        assert response is not None
+        assert response.status_code == status_code
+        assert handler.calls == 1
 
-            # Verify that no retry attempts were logged
-            log_text = caplog.text
-            assert "Attempt 2" not in log_text
-            assert "Failed to fetch" not in log_text
-        finally:
-            await client.close()
+    @pytest.mark.parametrize("status_code", [403, 429])
+    async def test_retries_then_gives_up_on_throttling_4xx(self, status_code: int):
+        """Verifies 403 and 429 are retried up to the attempt limit, then yield None."""
+        handler = CountingHandler(status_code)
+        async with HttpClient(transport=httpx.MockTransport(handler)) as client:
+            client.retryer = client.retryer.copy(wait=wait_none())
+            response = await client.get(f"http://mock/status/{status_code}")
+
+        assert response is None
+        assert handler.calls == 3
 
-    async def test_client_can_be_closed(self, tmp_path: Path):
+    async def test_client_can_be_closed(self):
         """
         Verifies that the client can be closed and raises an error on subsequent use.
         """
-        client = HttpClient(cache_dir=str(tmp_path))
+        client = HttpClient()
         await client.close()
 
     async def test_unexpected_errors_are_not_swallowed(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, client: HttpClient, monkeypatch: pytest.MonkeyPatch
     ):
         """Verifies unexpected client errors propagate to the caller."""
-        client = HttpClient(cache_dir=str(tmp_path))
 
         async def boom(*_args, **_kwargs):
             raise RuntimeError("boom")
 
         monkeypatch.setattr(client.client, "get", boom)
 
+        with pytest.raises(RuntimeError, match="boom"):
+            await client.get("https://example.com")
+
+    async def test_get_shares_one_fetch_per_url(
+        self, client: HttpClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Verifies concurrent GETs share one fetch and finished ones are not kept."""
+        calls: list[str] = []
+
+        async def fake_get(url: str):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, text=url, request=httpx.Request("GET", url))
+
+        monkeypatch.setattr(client.client, "get", fake_get)
+
+        url = "https://example.com/once"
+        first, second = await asyncio.gather(client.get(url), client.get(url))
+        assert first is second
+        assert calls == [url]
+
+        third = await client.get(url)
+        assert third is not first
+        assert calls == [url, url]
+
+    async def test_cancelling_last_waiter_cancels_shared_fetch(
+        self, client: HttpClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Verifies a shared fetch outlives one cancelled caller but not all."""
+        started = asyncio.Event()
+        finished: list[str] = []
+
+        async def fake_get(url: str):
+            started.set()
+            await asyncio.Event().wait()
+            finished.append(url)
+
+        monkeypatch.setattr(client.client, "get", fake_get)
+
+        url = "https://example.com/abandoned"
+        first = asyncio.create_task(client.get(url))
+        second = asyncio.create_task(client.get(url))
+        await started.wait()
+        fetch = client._in_flight[url]
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        assert not fetch.cancelled()
+        assert client._in_flight[url] is fetch
+
+        second.cancel()
+        await asyncio.gather(second, fetch, return_exceptions=True)
+        assert fetch.cancelled()
+        assert url not in client._in_flight
+        assert finished == []
+
+    async def test_close_cancels_in_flight_fetches(self):
+        """Verifies close() stops outstanding fetches before closing the clients."""
+        started = asyncio.Event()
+        finished = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            started.set()
+            await asyncio.Event().wait()
+            finished.append(str(request.url))
+            return httpx.Response(200)
+
+        client = HttpClient(rate_limit=1000.0, transport=httpx.MockTransport(handler))
+        caller = asyncio.create_task(client.get("https://example.com/slow"))
+        await started.wait()
+        fetch = client._in_flight["https://example.com/slow"]
+
+        await client.close()
+
+        assert fetch.cancelled()
+        assert client._in_flight == {}
+        assert client.client.is_closed
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert finished == []
+
+    async def test_async_context_manager_closes_client(self):
+        """Verifies the client stays open inside ``async with`` and closes after."""
+        async with HttpClient() as client:
+            assert not client.client.is_closed
+        assert client.client.is_closed
+        assert client._download_client.is_closed
+
+    async def test_download_streams_body_and_leaves_no_partial_file(
+        self, tmp_path: Path
+    ):
+        """Verifies downloads land atomically and failures leave nothing behind."""
+        body = b"x" * 200_000
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/missing.png":
+                return httpx.Response(404)
+            return httpx.Response(200, content=body)
+
+        image_path = tmp_path / "comic.png"
+        missing_path = tmp_path / "missing.png"
+        async with HttpClient(
+            rate_limit=1000.0, transport=httpx.MockTransport(handler)
+        ) as client:
+            assert await client.download("https://example.com/comic.png", image_path)
+            assert not await client.download(
+                "https://example.com/missing.png", missing_path
+            )
+
+        assert image_path.read_bytes() == body
+        assert not missing_path.exists()
+        assert list(tmp_path.glob("*.part")) == []
+
+    async def test_download_bypasses_response_cache(self, tmp_path: Path):
+        """Verifies image bodies are streamed from the network, never cached."""
+        handler_calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal handler_calls
+            handler_calls += 1
+            headers = {
+                "Cache-Control": "max-age=3600",
+                "Date": formatdate(usegmt=True),
+            }
+            return httpx.Response(200, content=b"png", headers=headers)
+
+        async with HttpClient(
+            rate_limit=1000.0, transport=httpx.MockTransport(handler)
+        ) as client:
+            for name in ("first.png", "second.png"):
+                assert await client.download(
+                    "https://example.com/comic.png", tmp_path / name
+                )
+
+        assert handler_calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.network
+@pytest.mark.usefixtures("warm_dns")
+class TestHttpClientLive:
+    """Smoke tests against the real httpbin.org; run with ``pytest -m network``."""
+
+    async def test_live_get_sends_custom_user_agent(self, shared_cache_dir: Path):
+        """Verifies a real round-trip through the network transport and cache."""
+        async with HttpClient(cache_dir=str(shared_cache_dir)) as client:
+            response = await client.get("https://httpbin.org/get")
+
+        assert response is not None
+        assert response.status_code == 200
+        assert response.json()["headers"]["User-Agent"] == "SMBC-Scraper/1.0"
+
+
+@pytest.mark.asyncio
+class TestRateLimiter:
+    """Tests for the token-bucket RateLimiter."""
+
+    async def test_concurrent_waiters_are_spaced_by_period(self):
+        """Verifies concurrent callers each reserve a slot rather than racing."""
+        limiter = RateLimiter(rate=20.0, burst=1.0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(*(limiter.wait() for _ in range(3)))
+
+        # First token is free; the next two wait one period (0.05s) each.
+        assert loop.time() - start >= 0.095
+
+    async def test_cancelled_waiter_returns_its_token(self):
+        """Verifies a caller cancelled while waiting does not use up a token."""
+        limiter = RateLimiter(rate=1.0, burst=1.0)
+        await limiter.wait()
+
+        waiter = asyncio.create_task(limiter.wait())
+        await asyncio.sleep(0)
+        assert limiter.tokens == -1.0
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert limiter.tokens == 0.0
+
+
+class TestOpenCacheDb:
+    """Tests for the SQLite cache bootstrap."""
+
+    def test_imports_legacy_file_cache_once(self, tmp_path: Path):
+        """Verifies old one-file-per-response entries are copied in on creation."""
+        key = "0123456789abcdef0123"
+        (tmp_path / key).write_text('{"response": {}}', encoding="utf-8")
+        (tmp_path / ".gitignore").write_text("*", encoding="utf-8")
+
+        connection = open_cache_db(tmp_path)
+        try:
+            rows = connection.execute("SELECT key, data FROM cache").fetchall()
+            indexes = connection.execute("PRAGMA index_list(cache)").fetchall()
+        finally:
+            connection.close()
+
+        assert rows == [(key, '{"response": {}}')]
+        assert any(index[1] == "cache_key_idx" for index in indexes)
+
+        # Re-opening an existing database must not import the files again.
+        connection = open_cache_db(tmp_path)
         try:
-            with pytest.raises(RuntimeError, match="boom"):
-                await client.get("https://example.com")
+            count = connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
         finally:
-            await client.close()
+            connection.close()
+        assert count == 1
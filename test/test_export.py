@@ -3,7 +3,10 @@ from __future__ import annotations
 from datetime import date
 from pathlib import Path
 
-from smbc_scraper.export import load_comics, merge_comics
+import pandas as pd
+import pytest
+
+from smbc_scraper.export import load_comics, merge_comics, save_comics
 from smbc_scraper.models import ComicRow
 
 
@@ -49,3 +52,33 @@ def test_merge_comics_prefers_new_rows_and_sorts():
     assert [row.slug for row in merged_rows] == ["alpha", "beta", "gamma"]
     beta_row = next(row for row in merged_rows if row.slug == "beta")
     assert beta_row.hover_text == "new beta"
+
+
+def test_save_comics_writes_requested_formats(tmp_path: Path):
+    rows = [
+        build_comic_row("beta", date(2024, 9, 2)),
+        build_comic_row("alpha", date(2024, 9, 1)),
+    ]
+
+    save_comics(rows, tmp_path, "smbc_ground_truth", formats=["csv", "xlsx"])
+
+    xlsx = pd.read_excel(tmp_path / "smbc_ground_truth.xlsx")
+    assert list(xlsx["slug"]) == ["alpha", "beta"]
+    assert list(xlsx["page_title"]) == ["Alpha", "Beta"]
+    assert not (tmp_path / "smbc_ground_truth.parquet").exists()
+    reloaded = load_comics(tmp_path / "smbc_ground_truth.csv")
+    assert [row.slug for row in reloaded] == ["alpha", "beta"]
+    assert reloaded[0].date == date(2024, 9, 1)
+
+
+def test_save_comics_gives_all_formats_one_mtime(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    rows = [build_comic_row(f"comic-{i}", date(2024, 9, 1)) for i in range(50)]
+
+    save_comics(rows, tmp_path, "ohnorobot", formats=["csv", "xlsx", "parquet"])
+
+    mtimes = {
+        (tmp_path / f"ohnorobot{suffix}").stat().st_mtime_ns
+        for suffix in (".csv", ".xlsx", ".parquet")
+    }
+    assert len(mtimes) == 1
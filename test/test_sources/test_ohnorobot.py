@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Optional
 
 import httpx
+import pandas as pd
 import pytest
 
 from smbc_scraper.sources.ohnorobot import OhNoRobotScraper
@@ -62,6 +64,38 @@ class TestOhNoRobotScraper:
         assert "Second line" in comic_text
         assert "ignored summary" not in comic_text
 
+    def test_parse_page_skips_non_http_links(
+        self, ohnorobot_scraper: OhNoRobotScraper
+    ):
+        html = """
+        <ul>
+          <li><blockquote><a class="searchlink" href="javascript:void(0)">x</a>
+          text</blockquote></li>
+          <li><blockquote><a class="searchlink" href="http:///comic/no-host">z</a>
+          text</blockquote></li>
+          <li><blockquote><a class="searchlink" href="/comic/kept">y</a>
+          text</blockquote></li>
+        </ul>
+        """
+
+        results = ohnorobot_scraper._parse_page(html)
+
+        assert [row.slug for row in results] == ["kept"]
+        assert results[0].legacy_id is None
+
+    def test_parse_page_strips_tinylink_then_summary_paragraph(
+        self, ohnorobot_scraper: OhNoRobotScraper
+    ):
+        html = (
+            '<ul><li><blockquote><a class="searchlink" href="/comic/kept">x</a>text'
+            '<div class="tinylink"><p>link</p></div><p>summary</p>'
+            "</blockquote></li></ul>"
+        )
+
+        results = ohnorobot_scraper._parse_page(html)
+
+        assert results[0].comic_text == "x\ntext"
+
     @pytest.mark.asyncio
     async def test_scrape_generates_queries_from_existing_csv_titles(
         self,
@@ -92,3 +126,155 @@ class TestOhNoRobotScraper:
 
         assert results == []
         assert captured_queries == ["Another Test Case", "Big Robot Theory"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_prefers_fresh_parquet_export(
+        self,
+        ohnorobot_scraper: OhNoRobotScraper,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        pytest.importorskip("pyarrow")
+        (tmp_path / "smbc_ground_truth.csv").write_text(
+            "url,page_title\nhttps://www.smbc-comics.com/comic/1,Stale Title\n",
+            encoding="utf-8",
+        )
+        pd.DataFrame(
+            {
+                "url": ["https://www.smbc-comics.com/comic/1"],
+                "page_title": ["Fresh Parquet Title"],
+            }
+        ).to_parquet(tmp_path / "smbc_ground_truth.parquet", index=False)
+
+        captured_queries: list[str] = []
+
+        async def fake_run_queries(queries: list[str]):
+            captured_queries.extend(queries)
+            return []
+
+        monkeypatch.setattr(ohnorobot_scraper, "_run_queries", fake_run_queries)
+
+        await ohnorobot_scraper.scrape(tmp_path, limit=10)
+
+        assert captured_queries == ["Fresh Parquet Title"]
+
+    @pytest.mark.asyncio
+    async def test_run_queries_paginates_each_query_until_exhausted(
+        self, ohnorobot_scraper: OhNoRobotScraper, monkeypatch: pytest.MonkeyPatch
+    ):
+        def page_html(slug: str) -> str:
+            return (
+                "<ul><li><blockquote>"
+                f'<a class="searchlink" href="/comic/{slug}">{slug}</a>text'
+                "</blockquote></li></ul>"
+            )
+
+        pages = {
+            ("alpha", "0"): page_html("one"),
+            ("alpha", "1"): page_html("two"),
+            ("beta", "0"): page_html("two"),
+        }
+        requested: list[tuple[str, str]] = []
+
+        async def fake_get(url: str):
+            params = httpx.URL(url).params
+            key = (params["s"], params["page"])
+            requested.append(key)
+            return httpx.Response(200, text=pages.get(key, "<ul></ul>"))
+
+        monkeypatch.setattr(ohnorobot_scraper.client, "get", fake_get)
+
+        results = await ohnorobot_scraper._run_queries(["alpha", "beta"])
+
+        assert [row.slug for row in results] == ["one", "two"]
+        assert ("alpha", "2") in requested
+        assert ("alpha", "4") not in requested
+        assert ("beta", "3") not in requested
+
+    async def test_parse_response_honours_the_declared_charset(
+        self, ohnorobot_scraper: OhNoRobotScraper
+    ):
+        html = (
+            "<ul><li><blockquote>"
+            '<a class="searchlink" href="/comic/cafe">x</a>caf\u00e9 \u2014 ol\u00e9'
+            "</blockquote></li></ul>"
+        )
+        response = httpx.Response(
+            200,
+            content=html.encode("cp1252"),
+            headers={"Content-Type": "text/html; charset=windows-1252"},
+        )
+
+        results = await ohnorobot_scraper._parse_response("cafe", 0, response)
+
+        assert [row.comic_text for row in results] == ["x\ncaf\u00e9 \u2014 ol\u00e9"]
+
+    async def test_paginate_query_cancels_prefetch_past_last_page(
+        self, ohnorobot_scraper: OhNoRobotScraper, monkeypatch: pytest.MonkeyPatch
+    ):
+        cancelled: list[str] = []
+
+        async def fake_get(url: str):
+            page = httpx.URL(url).params["page"]
+            if page == "0":
+                return httpx.Response(
+                    200,
+                    text=(
+                        "<ul><li><blockquote>"
+                        '<a class="searchlink" href="/comic/one">x</a>text'
+                        "</blockquote></li></ul>"
+                    ),
+                )
+            if page == "1":
+                return httpx.Response(200, text="<ul></ul>")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+
+        monkeypatch.setattr(ohnorobot_scraper.client, "get", fake_get)
+
+        query_comics = await ohnorobot_scraper._paginate_query("alpha")
+
+        assert [row.slug for row in query_comics.values()] == ["one"]
+        assert cancelled == ["2"]
+
+    async def test_paginate_query_does_not_prefetch_after_failed_page(
+        self, ohnorobot_scraper: OhNoRobotScraper, monkeypatch: pytest.MonkeyPatch
+    ):
+        requested: list[str] = []
+
+        async def fake_get(url: str):
+            requested.append(httpx.URL(url).params["page"])
+            return httpx.Response(503)
+
+        monkeypatch.setattr(ohnorobot_scraper.client, "get", fake_get)
+
+        assert await ohnorobot_scraper._paginate_query("alpha") == {}
+        assert requested == ["0"]
+
+    async def test_run_queries_prefers_earlier_query_regardless_of_timing(
+        self, ohnorobot_scraper: OhNoRobotScraper, monkeypatch: pytest.MonkeyPatch
+    ):
+        async def fake_get(url: str):
+            params = httpx.URL(url).params
+            query, page = params["s"], params["page"]
+            if page != "0":
+                return httpx.Response(200, text="<ul></ul>")
+            # The first query answers last, so completion order is reversed.
+            await asyncio.sleep(0.02 if query == "alpha" else 0)
+            return httpx.Response(
+                200,
+                text=(
+                    "<ul><li><blockquote>"
+                    f'<a class="searchlink" href="/comic/shared">x</a>{query}'
+                    "</blockquote></li></ul>"
+                ),
+            )
+
+        monkeypatch.setattr(ohnorobot_scraper.client, "get", fake_get)
+
+        results = await ohnorobot_scraper._run_queries(["alpha", "beta"])
+
+        assert [row.comic_text for row in results] == ["x\nalpha"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 from pathlib import Path
 from types import SimpleNamespace
@@ -7,7 +8,9 @@ from typing import Optional
 
 import httpx
 import pytest
+import pytest_asyncio
 
+from smbc_scraper.core.http import HttpClient
 from smbc_scraper.models import ComicRow
 from smbc_scraper.sources.smbc import (
     IncrementalScrapeState,
@@ -21,12 +24,39 @@ class DummyHttpClient:
     async def get(self, url: str) -> Optional[httpx.Response]:
         raise AssertionError("HTTP should not be called in parser unit tests")
 
+    async def download(self, url: str, path: Path) -> bool:
+        raise AssertionError("HTTP should not be called in parser unit tests")
+
 
 @pytest.fixture
 def smbc_scraper(tmp_path: Path) -> SmbcScraper:
     return SmbcScraper(http_client=DummyHttpClient(), data_dir=str(tmp_path))
 
 
+# The current comic (home page) and the very first legacy-ID comic.
+MODERN_COMIC_URL = "https://www.smbc-comics.com/"
+OLD_COMIC_URL = "https://www.smbc-comics.com/index.php?db=comics&id=1"
+
+
+@pytest_asyncio.fixture(scope="module")
+async def live_comic_pages(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> list[tuple[str, str]]:
+    """(final URL, HTML) for the modern and old comic pages, fetched together."""
+    async with HttpClient(
+        cache_dir=str(tmp_path_factory.mktemp("smbc_cache"))
+    ) as client:
+        responses = await asyncio.gather(
+            client.get(MODERN_COMIC_URL), client.get(OLD_COMIC_URL)
+        )
+
+    pages = []
+    for response in responses:
+        assert response is not None and response.status_code == 200
+        pages.append((str(response.url), response.text))
+    return pages
+
+
 def build_comic_row(slug: str, day: int) -> ComicRow:
     return ComicRow(
         url=f"https://www.smbc-comics.com/comic/{slug}",
@@ -150,6 +180,53 @@ class TestSmbcScraperParsing:
             ),
         ]
 
+    def test_parse_page_prefers_cc_comic_then_container_fallbacks(
+        self, smbc_scraper: SmbcScraper
+    ):
+        page = """
+        <html>
+          <head>
+            <link rel="canonical" href="https://www.smbc-comics.com/comic/x" />
+          </head>
+          <body>
+            {body}
+          </body>
+        </html>
+        """
+        with_id = page.format(
+            body='<div id="comic"><img src="/comics/banner.png" /></div>'
+            '<img id="cc-comic" src="/comics/main.png" />'
+        )
+        body_only = page.format(
+            body='<div id="cc-comicbody"><img src="/comics/body.png" /></div>'
+        )
+
+        _, with_id_images = smbc_scraper._parse_page("https://x.test", with_id)
+        _, body_only_images = smbc_scraper._parse_page("https://x.test", body_only)
+
+        assert with_id_images[0][0] == "https://www.smbc-comics.com/comics/main.png"
+        assert body_only_images[0][0] == "https://www.smbc-comics.com/comics/body.png"
+
+    @pytest.mark.asyncio
+    async def test_download_image_replaces_zero_byte_leftovers(
+        self, smbc_scraper: SmbcScraper, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        existing = tmp_path / "existing.png"
+        existing.write_bytes(b"image")
+        truncated = tmp_path / "truncated.png"
+        truncated.write_bytes(b"")
+        downloaded: list[Path] = []
+
+        async def fake_download(_url: str, path: Path) -> bool:
+            downloaded.append(path)
+            return True
+
+        monkeypatch.setattr(smbc_scraper.client, "download", fake_download)
+
+        assert await smbc_scraper._download_image("https://x.test/a.png", existing)
+        assert await smbc_scraper._download_image("https://x.test/b.png", truncated)
+        assert downloaded == [truncated]
+
 
 class TestSmbcIncrementalState:
     def test_resolve_incremental_start_id_uses_saved_state(self, tmp_path: Path):
@@ -209,6 +286,86 @@ class TestSmbcIncrementalAndBackfill:
         assert latest_id == 42
         assert [row.slug for row in rows] == ["forty-two"]
 
+    @pytest.mark.asyncio
+    async def test_scrape_id_range_drops_misses_and_sorts_by_date(
+        self, smbc_scraper: SmbcScraper, monkeypatch: pytest.MonkeyPatch
+    ):
+        available_rows = {
+            1: build_comic_row("later", 9),
+            3: build_comic_row("earlier", 2),
+        }
+
+        async def fake_scrape_one(comic_id: int):
+            return available_rows.get(comic_id)
+
+        monkeypatch.setattr(smbc_scraper, "_scrape_one_comic", fake_scrape_one)
+
+        rows = await smbc_scraper.scrape_id_range(1, 4)
+
+        assert [row.slug for row in rows] == ["earlier", "later"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_one_comic_skips_fetch_when_files_exist(
+        self, smbc_scraper: SmbcScraper, monkeypatch: pytest.MonkeyPatch
+    ):
+        html = """
+        <html>
+          <head><title>Saturday Morning Breakfast Cereal - Cached</title></head>
+          <body>
+            <img id="cc-comic" src="/comics/20240902.png" title="hover" />
+          </body>
+        </html>
+        """
+        calls: list[str] = []
+
+        async def fake_get(url: str):
+            calls.append(url)
+            return SimpleNamespace(
+                status_code=200,
+                url="https://www.smbc-comics.com/comic/cached",
+                text=html,
+            )
+
+        async def fake_download(_url: str, path: Path) -> bool:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"image")
+            return True
+
+        monkeypatch.setattr(smbc_scraper.client, "get", fake_get)
+        monkeypatch.setattr(smbc_scraper.client, "download", fake_download)
+
+        first = await smbc_scraper._scrape_one_comic(12)
+        second = await smbc_scraper._scrape_one_comic(12)
+
+        assert first is not None
+        assert second == first
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_rebuild_id_index_backfills_only_missing_ids(
+        self, smbc_scraper: SmbcScraper, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        source_csv = tmp_path / "smbc_ground_truth.csv"
+        source_csv.write_text(
+            "url,slug,legacy_id,date,source\n"
+            "https://www.smbc-comics.com/comic/one,one,1,2024-09-01,smbc\n"
+            "https://www.smbc-comics.com/comic/two,two,,2024-09-02,smbc\n",
+            encoding="utf-8",
+        )
+        slugs_by_id = {1: "one", 2: "two"}
+
+        async def fake_row_for_id(comic_id: int):
+            slug = slugs_by_id.get(comic_id)
+            return build_comic_row(slug, comic_id) if slug else None
+
+        monkeypatch.setattr(smbc_scraper, "_get_row_for_legacy_id", fake_row_for_id)
+
+        rows = await smbc_scraper.rebuild_id_index_from_local_files(
+            source_csv, max_id=3
+        )
+
+        assert {row.slug: row.legacy_id for row in rows} == {"one": 1, "two": 2}
+
     @pytest.mark.asyncio
     async def test_scrape_incremental_stops_after_bounded_misses(
         self, smbc_scraper: SmbcScraper, monkeypatch: pytest.MonkeyPatch
@@ -294,3 +451,31 @@ class TestSmbcIncrementalAndBackfill:
         assert downloaded_paths == [
             tmp_path / "images" / "2024" / "09" / "01" / "critical-votey.png"
         ]
+
+
+@pytest.mark.network
+@pytest.mark.usefixtures("warm_dns")
+class TestSmbcScraperIntegration:
+    """End-to-end checks against the live site; run with ``pytest -m network``."""
+
+    def test_parse_page_handles_modern_and_old_layouts(
+        self, smbc_scraper: SmbcScraper, live_comic_pages: list[tuple[str, str]]
+    ):
+        for url, html in live_comic_pages:
+            comic_row, images = smbc_scraper._parse_page(url, html)
+
+            assert comic_row is not None, url
+            assert comic_row.slug
+            assert images, url
+
+    @pytest.mark.asyncio
+    async def test_scrape_one_comic(self, tmp_path: Path):
+        async with HttpClient() as client:
+            scraper = SmbcScraper(http_client=client, data_dir=str(tmp_path))
+            comic_row = await scraper._scrape_one_comic(1)
+
+        assert comic_row is not None
+        assert comic_row.legacy_id == 1
+        assert list((tmp_path / "html").rglob("*.html"))
+        assert list((tmp_path / "images").rglob("*-main.*"))
+        assert scraper._load_scraped_comic(1) == comic_row
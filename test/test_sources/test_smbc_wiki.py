@@ -56,6 +56,7 @@ Bonus line
             class FakeResponse:
                 status_code = 200
                 text = '{"error": {"code": "missingtitle"}}'
+                content = text.encode("utf-8")
                 def json(self):
                     return {"error": {"code": "missingtitle"}}
             return FakeResponse()
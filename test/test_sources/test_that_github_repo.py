@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+from smbc_scraper.sources.that_github_repo import (
+    _extract_front_matter,
+    iter_markdown_files,
+    parse_markdown_file,
+)
+
+
+class TestExtractFrontMatter:
+    def test_flat_front_matter_keeps_strings_and_strips_quotes(self):
+        text = (
+            "---\n"
+            "title: Titan\n"
+            "hovertext: 'It''s a moon'\n"
+            'image: "https://www.smbc-comics.com/comics/20210612.png"\n'
+            "extra_image:\n"
+            "---\n"
+            "Body text\n"
+        )
+
+        fm, body = _extract_front_matter(text)
+
+        assert fm == {
+            "title": "Titan",
+            "hovertext": "It's a moon",
+            "image": "https://www.smbc-comics.com/comics/20210612.png",
+            "extra_image": None,
+        }
+        assert body == "Body text\n"
+
+    def test_structured_front_matter_falls_back_to_yaml(self):
+        text = "---\ntitle: Titan\ntags:\n  - space\n  - moons\n---\nBody\n"
+
+        fm, body = _extract_front_matter(text)
+
+        assert fm == {"title": "Titan", "tags": ["space", "moons"]}
+        assert body == "Body\n"
+
+    def test_closing_delimiter_allows_trailing_whitespace_and_crlf(self):
+        text = "---\r\ntitle: Titan\r\n---  \r\nBody\r\n---\r\nMore\r\n"
+
+        fm, body = _extract_front_matter(text)
+
+        assert fm == {"title": "Titan"}
+        assert body == "Body\r\n---\r\nMore\r\n"
+
+    def test_text_without_front_matter_is_returned_unchanged(self):
+        text = "No front matter here\n---\nstill body\n"
+
+        assert _extract_front_matter(text) == ({}, text)
+
+
+def test_parse_markdown_file_builds_row(tmp_path: Path):
+    path = tmp_path / "2021-06-12-titan.md"
+    path.write_text(
+        "---\n"
+        "title: Titan\n"
+        "hovertext: Moons!\n"
+        "image: https://www.smbc-comics.com/comics/20210612.png\n"
+        "---\n"
+        "\n"
+        "Transcript\n",
+        encoding="utf-8",
+    )
+
+    row = parse_markdown_file(path)
+
+    assert row.slug == "2021-06-12-titan"
+    assert row.url == "https://www.smbc-comics.com/comic/2021-06-12-titan"
+    assert row.page_title == "Titan"
+    assert row.hover_text == "Moons!"
+    assert row.date == date(2021, 6, 12)
+    assert row.comic_text == "Transcript"
+
+
+def test_iter_markdown_files_walks_nested_dirs_for_both_suffixes(tmp_path: Path):
+    (tmp_path / "2021" / "06").mkdir(parents=True)
+    expected = {
+        tmp_path / "top.md",
+        tmp_path / "2021" / "mid.markdown",
+        tmp_path / "2021" / "06" / "deep.md",
+    }
+    for path in expected:
+        path.write_text("body\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored\n", encoding="utf-8")
+    (tmp_path / "folder.md").mkdir()
+
+    assert set(iter_markdown_files(tmp_path)) == expected